@@ -0,0 +1,89 @@
+"""Micro-batching of concurrent single-text embedding requests."""
+
+import asyncio
+from typing import Callable, List, Optional, Tuple
+
+import numpy as np
+
+
+class EmbedBatcher:
+    """
+    Coalesces concurrent single-text embedding requests into batched calls.
+
+    Requests arriving within ``max_wait_ms`` of each other (up to
+    ``max_batch_size``) are encoded together in a worker thread, so the event
+    loop stays free while the model runs.
+    """
+
+    def __init__(
+        self,
+        encode_fn: Callable[[List[str]], np.ndarray],
+        max_batch_size: int = 32,
+        max_wait_ms: float = 10.0,
+    ):
+        """
+        Initialize the batcher.
+
+        Args:
+            encode_fn: Function encoding a list of texts into an (N, D) array
+            max_batch_size: Maximum number of texts encoded in one call
+            max_wait_ms: Maximum time to wait for more requests to batch
+        """
+        self.encode_fn = encode_fn
+        self.max_batch_size = max_batch_size
+        self.max_wait = max_wait_ms / 1000.0
+        self._queue: Optional[asyncio.Queue] = None
+        self._worker: Optional[asyncio.Task] = None
+
+    async def embed(self, text: str) -> np.ndarray:
+        """
+        Embed a single text as part of the next batch.
+
+        Args:
+            text: Text to embed
+
+        Returns:
+            Embedding vector
+        """
+        if self._worker is None or self._worker.done():
+            self._queue = asyncio.Queue()
+            self._worker = asyncio.create_task(self._run())
+
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((text, future))
+        return await future
+
+    async def _collect_batch(self) -> List[Tuple[str, asyncio.Future]]:
+        """Wait for a request, then gather more until the batch is full or times out."""
+        loop = asyncio.get_running_loop()
+        batch = [await self._queue.get()]
+        deadline = loop.time() + self.max_wait
+
+        while len(batch) < self.max_batch_size:
+            timeout = deadline - loop.time()
+            if timeout <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout))
+            except asyncio.TimeoutError:
+                break
+
+        return batch
+
+    async def _run(self) -> None:
+        """Worker loop encoding batches and resolving their futures."""
+        while True:
+            batch = await self._collect_batch()
+            texts = [text for text, _ in batch]
+
+            try:
+                embeddings = await asyncio.to_thread(self.encode_fn, texts)
+            except Exception as e:
+                for _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+
+            for (_, future), embedding in zip(batch, embeddings):
+                if not future.done():
+                    future.set_result(embedding)
@@ -1,10 +1,15 @@
 """Embedding generation using sentence-transformers."""
 
+import logging
 from typing import List, Union
 
 import numpy as np
 from sentence_transformers import SentenceTransformer
 
+from app.embed_batcher import EmbedBatcher
+
+logger = logging.getLogger(__name__)
+
 
 class Embedder:
     """Embedding generator using sentence-transformers."""
@@ -13,6 +18,7 @@ class Embedder:
         self,
         model_name: str = "all-MiniLM-L6-v2",
         normalize: bool = True,
+        backend: str = "torch",
     ):
         """
         Initialize the embedder.
@@ -20,11 +26,31 @@ class Embedder:
         Args:
             model_name: Name of the sentence-transformers model
             normalize: Whether to normalize embeddings (L2 norm)
+            backend: Inference backend, "torch" or "onnx" (requires
+                optimum[onnxruntime]). Falls back to "torch" if the ONNX
+                backend cannot be loaded.
         """
         self.model_name = model_name
         self.normalize = normalize
-        self.model = SentenceTransformer(model_name)
+        self.backend = backend
+        if backend == "torch":
+            self.model = SentenceTransformer(model_name)
+        else:
+            try:
+                self.model = SentenceTransformer(model_name, backend=backend)
+            except Exception as e:
+                logger.warning(
+                    f"Failed to load {backend} backend ({e}), falling back to torch"
+                )
+                self.backend = "torch"
+                self.model = SentenceTransformer(model_name)
+
+        # Half precision halves memory traffic on GPU
+        if self.backend == "torch" and self.model.device.type == "cuda":
+            self.model.half()
+
         self.embedding_dim = self.model.get_sentence_embedding_dimension()
+        self._batcher = EmbedBatcher(self.embed)
 
     def embed(self, text: Union[str, List[str]]) -> Union[np.ndarray, List[np.ndarray]]:
         """
@@ -51,7 +77,19 @@ class Embedder:
             )
             return embeddings
 
-    def embed_batch(self, texts: List[str], batch_size: int = 32) -> List[np.ndarray]:
+    async def embed_async(self, text: str) -> np.ndarray:
+        """
+        Generate an embedding for text, batched with concurrent requests.
+
+        Args:
+            text: Text string
+
+        Returns:
+            Embedding vector as numpy array
+        """
+        return await self._batcher.embed(text)
+
+    def embed_batch(self, texts: List[str], batch_size: int = 32) -> np.ndarray:
         """
         Generate embeddings for a batch of texts.
 
@@ -60,7 +98,7 @@ class Embedder:
             batch_size: Batch size for processing
 
         Returns:
-            List of embedding vectors
+            Array of embedding vectors with shape (len(texts), embedding_dim)
         """
         embeddings = self.model.encode(
             texts,
@@ -68,7 +106,7 @@ class Embedder:
             batch_size=batch_size,
             show_progress_bar=True,
         )
-        return embeddings.tolist()
+        return embeddings
 
     def get_embedding_dim(self) -> int:
         """Get the dimension of embeddings."""
@@ -0,0 +1,260 @@
+"""Semantic cache for LLM responses."""
+
+import asyncio
+import hashlib
+import json
+import sqlite3
+import threading
+from collections import OrderedDict
+from pathlib import Path
+from typing import Any, Awaitable, Callable, Dict, List, Optional, Tuple, Union
+
+import numpy as np
+
+# Maximum number of entries kept per cache namespace
+MAX_CACHE_ENTRIES = 10_000
+
+
+class _Bucket:
+    """
+    Embeddings of cached entries sharing a scope, for similarity lookup.
+
+    Rows are stored in a growable buffer; removing a row moves the last row
+    into its place.
+    """
+
+    def __init__(self, dim: int):
+        self._buffer = np.empty((16, dim), dtype=np.float32)
+        self._keys: List[str] = []
+        self._rows: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._keys)
+
+    def add(self, key_hash: str, embedding: np.ndarray) -> None:
+        """Append a row for an entry."""
+        n = len(self._keys)
+        if n == self._buffer.shape[0]:
+            buffer = np.empty((2 * n, self._buffer.shape[1]), dtype=np.float32)
+            buffer[:n] = self._buffer
+            self._buffer = buffer
+        self._buffer[n] = embedding
+        self._rows[key_hash] = n
+        self._keys.append(key_hash)
+
+    def remove(self, key_hash: str) -> None:
+        """Remove an entry's row if present."""
+        row = self._rows.pop(key_hash, None)
+        if row is None:
+            return
+        last = len(self._keys) - 1
+        if row != last:
+            self._buffer[row] = self._buffer[last]
+            moved_key = self._keys[last]
+            self._keys[row] = moved_key
+            self._rows[moved_key] = row
+        self._keys.pop()
+
+    def best_match(self, embedding: np.ndarray) -> Tuple[Optional[str], float]:
+        """Return the key of the most similar entry and its cosine similarity."""
+        n = len(self._keys)
+        if n == 0:
+            return None, -1.0
+        similarities = self._buffer[:n] @ embedding
+        best = int(np.argmax(similarities))
+        return self._keys[best], float(similarities[best])
+
+
+class SemanticCache:
+    """
+    Cache of LLM responses keyed by the embedding of their input text.
+
+    Lookups first try an exact match on a content hash, then fall back to the
+    most similar cached input (cosine similarity above ``threshold``). Entries
+    can be partitioned by ``scope`` so that semantic matches are only made
+    between inputs that share it (e.g. explanations for the same paper).
+    With ``semantic=False`` only exact matches are served and no embeddings
+    are computed, which suits per-document results where near-identical
+    inputs (e.g. two versions of a paper) must not share a value.
+    Once ``max_entries`` is exceeded the least recently used entry is evicted.
+    """
+
+    def __init__(
+        self,
+        embed_fn: Optional[Callable[[str], Awaitable[np.ndarray]]],
+        namespace: str,
+        threshold: float = 0.97,
+        persist_path: Optional[Union[str, Path]] = None,
+        max_entries: int = MAX_CACHE_ENTRIES,
+        semantic: bool = True,
+    ):
+        """
+        Initialize the cache.
+
+        Args:
+            embed_fn: Coroutine function returning an L2-normalized embedding
+                for a text (unused when semantic is False)
+            namespace: Name separating this cache from others in the same file
+            threshold: Minimum cosine similarity for a semantic hit
+            persist_path: Optional SQLite file used to persist entries
+            max_entries: Maximum number of entries kept in memory and on disk
+            semantic: Whether to serve similar, not only identical, inputs
+        """
+        self.embed_fn = embed_fn
+        self.namespace = namespace
+        self.threshold = threshold
+        self.max_entries = max_entries
+        self.semantic = semantic
+        self._exact: Dict[str, Any] = {}
+        # Scope of every entry, least recently used first
+        self._scopes: "OrderedDict[str, str]" = OrderedDict()
+        self._buckets: Dict[str, _Bucket] = {}
+
+        self._conn = None
+        self._conn_lock = threading.Lock()
+        if persist_path is not None:
+            self._conn = sqlite3.connect(str(persist_path), check_same_thread=False)
+            self._conn.execute(
+                """CREATE TABLE IF NOT EXISTS llm_cache (
+                    namespace TEXT NOT NULL,
+                    key_hash TEXT NOT NULL,
+                    scope TEXT NOT NULL,
+                    embedding BLOB NOT NULL,
+                    value TEXT NOT NULL,
+                    PRIMARY KEY (namespace, key_hash)
+                )"""
+            )
+            self._conn.commit()
+            self._load()
+
+    def _load(self) -> None:
+        """Load the most recent persisted entries for this namespace, dropping the rest."""
+        rows = self._conn.execute(
+            """SELECT key_hash, scope, embedding, value FROM llm_cache
+            WHERE namespace = ? ORDER BY rowid DESC LIMIT ?""",
+            (self.namespace, self.max_entries),
+        ).fetchall()
+        # Rows come newest first; insert oldest first to keep the LRU order
+        for key_hash, scope, embedding_blob, value_json in reversed(rows):
+            embedding = None
+            if self.semantic and embedding_blob:
+                embedding = np.frombuffer(embedding_blob, dtype=np.float32)
+            self._insert(key_hash, scope, embedding, json.loads(value_json))
+
+        self._conn.execute(
+            """DELETE FROM llm_cache WHERE namespace = ? AND rowid NOT IN (
+                SELECT rowid FROM llm_cache WHERE namespace = ? ORDER BY rowid DESC LIMIT ?
+            )""",
+            (self.namespace, self.namespace, self.max_entries),
+        )
+        self._conn.commit()
+
+    def _insert(
+        self, key_hash: str, scope: str, embedding: Optional[np.ndarray], value: Any
+    ) -> List[str]:
+        """
+        Insert an entry into the in-memory indexes.
+
+        Returns:
+            Keys of the entries evicted to stay within max_entries
+        """
+        self._remove(key_hash)
+        self._exact[key_hash] = value
+        self._scopes[key_hash] = scope
+        if embedding is not None:
+            bucket = self._buckets.get(scope)
+            if bucket is None:
+                bucket = self._buckets[scope] = _Bucket(embedding.shape[0])
+            bucket.add(key_hash, embedding)
+
+        evicted = []
+        while len(self._scopes) > self.max_entries:
+            oldest = next(iter(self._scopes))
+            self._remove(oldest)
+            evicted.append(oldest)
+        return evicted
+
+    def _remove(self, key_hash: str) -> None:
+        """Remove an entry from the in-memory indexes if present."""
+        scope = self._scopes.pop(key_hash, None)
+        if scope is None:
+            return
+        del self._exact[key_hash]
+        bucket = self._buckets.get(scope)
+        if bucket is not None:
+            bucket.remove(key_hash)
+            if not len(bucket):
+                del self._buckets[scope]
+
+    def _persist(
+        self,
+        key_hash: str,
+        scope: str,
+        embedding: Optional[np.ndarray],
+        value: Any,
+        evicted: List[str],
+    ) -> None:
+        """Write an entry and delete evicted ones (run in a worker thread)."""
+        embedding_blob = embedding.tobytes() if embedding is not None else b""
+        with self._conn_lock:
+            self._conn.execute(
+                "INSERT OR REPLACE INTO llm_cache VALUES (?, ?, ?, ?, ?)",
+                (self.namespace, key_hash, scope, embedding_blob, json.dumps(value)),
+            )
+            if evicted:
+                self._conn.executemany(
+                    "DELETE FROM llm_cache WHERE namespace = ? AND key_hash = ?",
+                    [(self.namespace, evicted_key) for evicted_key in evicted],
+                )
+            self._conn.commit()
+
+    @staticmethod
+    def _hash(text: str, scope: str) -> str:
+        """Hash a text together with its scope."""
+        return hashlib.sha256(f"{scope}\x00{text}".encode("utf-8")).hexdigest()
+
+    async def get_or_compute(
+        self,
+        text: str,
+        compute: Callable[[], Awaitable[Any]],
+        scope: str = "",
+        embedding: Optional[np.ndarray] = None,
+    ) -> Any:
+        """
+        Return the cached value for a text, computing and storing it on a miss.
+
+        Args:
+            text: Input text the value was derived from
+            compute: Coroutine function producing the value on a cache miss
+            scope: Optional partition restricting semantic matches
+            embedding: Precomputed embedding of ``text``, if available
+                (ignored when semantic is False)
+
+        Returns:
+            Cached or freshly computed value
+        """
+        key_hash = self._hash(text, scope)
+        if key_hash in self._exact:
+            self._scopes.move_to_end(key_hash)
+            return self._exact[key_hash]
+
+        if not self.semantic:
+            embedding = None
+        else:
+            if embedding is None:
+                embedding = await self.embed_fn(text)
+            embedding = np.asarray(embedding, dtype=np.float32)
+            bucket = self._buckets.get(scope)
+            if bucket is not None:
+                match, similarity = bucket.best_match(embedding)
+                if match is not None and similarity >= self.threshold:
+                    self._scopes.move_to_end(match)
+                    return self._exact[match]
+
+        value = await compute()
+        evicted = self._insert(key_hash, scope, embedding, value)
+
+        if self._conn is not None:
+            await asyncio.to_thread(self._persist, key_hash, scope, embedding, value, evicted)
+
+        return value
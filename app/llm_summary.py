@@ -1,9 +1,31 @@
 """LLM-based text summarization and keyword extraction."""
 
+import json
 import os
-from typing import List
+from pathlib import Path
+from typing import List, Optional, Tuple, Union
 
-from openai import OpenAI
+from openai import AsyncOpenAI
+
+from app.llm_cache import SemanticCache
+
+# Maximum number of input characters sent to the LLM (to avoid token limits)
+MAX_INPUT_CHARS = 8000
+
+
+def _prepare_text(text: str) -> str:
+    """
+    Truncate text to the LLM input budget.
+
+    Args:
+        text: Raw input text
+
+    Returns:
+        Text of at most MAX_INPUT_CHARS characters, plus an ellipsis if cut
+    """
+    if len(text) > MAX_INPUT_CHARS:
+        return text[:MAX_INPUT_CHARS] + "..."
+    return text
 
 
 class LLMProcessor:
@@ -22,7 +44,7 @@ class LLMProcessor:
             raise ValueError(
                 "OpenAI API key not provided. Set OPENAI_API_KEY environment variable."
             )
-        self.client = OpenAI(api_key=self.api_key)
+        self.client = AsyncOpenAI(api_key=self.api_key)
         self.model = model
 
     async def summarize(self, text: str, max_sentences: int = 6) -> str:
@@ -36,10 +58,7 @@ class LLMProcessor:
         Returns:
             Summary string
         """
-        # Truncate text if too long (to avoid token limits)
-        max_chars = 8000
-        if len(text) > max_chars:
-            text = text[:max_chars] + "..."
+        text = _prepare_text(text)
 
         prompt = f"""Summarize the following research paper text in {max_sentences} sentences or less. Focus on the main contributions, methods, and findings.
 
@@ -49,7 +68,7 @@ Text:
 Summary:"""
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -79,10 +98,7 @@ Summary:"""
         Returns:
             List of keyword strings
         """
-        # Truncate text if too long
-        max_chars = 8000
-        if len(text) > max_chars:
-            text = text[:max_chars] + "..."
+        text = _prepare_text(text)
 
         prompt = f"""Extract {num_keywords} key terms, techniques, or concepts from the following research paper text. Return only a comma-separated list of keywords, no explanations.
 
@@ -92,7 +108,7 @@ Text:
 Keywords:"""
 
         try:
-            response = self.client.chat.completions.create(
+            response = await self.client.chat.completions.create(
                 model=self.model,
                 messages=[
                     {
@@ -116,9 +132,69 @@ Keywords:"""
         except Exception as e:
             raise ValueError(f"Failed to extract keywords: {str(e)}")
 
+    async def summarize_and_extract_keywords(
+        self, text: str, max_sentences: int = 6, num_keywords: int = 10
+    ) -> Tuple[str, List[str]]:
+        """
+        Generate a summary and extract keywords with a single LLM request.
+
+        Args:
+            text: Text to analyze
+            max_sentences: Maximum number of sentences in summary
+            num_keywords: Number of keywords to extract
+
+        Returns:
+            Tuple of summary string and list of keyword strings
+        """
+        text = _prepare_text(text)
+
+        prompt = f"""Analyze the following research paper text. Return a JSON object with two fields:
+- "summary": a summary in {max_sentences} sentences or less, focusing on the main contributions, methods, and findings.
+- "keywords": a list of {num_keywords} key terms, techniques, or concepts.
+
+Text:
+{text}"""
+
+        try:
+            response = await self.client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert at summarizing research papers and identifying their key terms and concepts.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.3,
+                max_tokens=500,
+                response_format={"type": "json_object"},
+            )
+
+            result = json.loads(response.choices[0].message.content)
+            summary = result["summary"]
+            keywords = result["keywords"]
+            # Accept keywords returned as a single comma-separated string
+            if isinstance(keywords, str):
+                keywords = keywords.split(",")
+            if not isinstance(summary, str) or not isinstance(keywords, list):
+                raise ValueError("unexpected response format")
+
+            summary = summary.strip()
+            keywords = [str(kw).strip() for kw in keywords if str(kw).strip()]
+            # Limit to requested number
+            keywords = keywords[:num_keywords]
+
+            return summary, keywords
+
+        except Exception as e:
+            raise ValueError(f"Failed to generate summary and keywords: {str(e)}")
 
-# Global instance
+
+# Global instances
 _llm_processor: LLMProcessor = None
+_summary_cache: Optional[SemanticCache] = None
+_keywords_cache: Optional[SemanticCache] = None
+_summary_keywords_cache: Optional[SemanticCache] = None
 
 
 def _get_llm_processor() -> LLMProcessor:
@@ -129,6 +205,25 @@ def _get_llm_processor() -> LLMProcessor:
     return _llm_processor
 
 
+def configure_cache(persist_path: Optional[Union[str, Path]] = None) -> None:
+    """
+    Enable caching of summaries and keywords.
+
+    Results are derived from a whole document, so they are only reused for
+    identical text: documents with a near-identical first page (e.g. a
+    preprint and its camera-ready version) embed almost the same.
+
+    Args:
+        persist_path: Optional SQLite file used to persist cached responses
+    """
+    global _summary_cache, _keywords_cache, _summary_keywords_cache
+    _summary_cache = SemanticCache(None, "summary", persist_path=persist_path, semantic=False)
+    _keywords_cache = SemanticCache(None, "keywords", persist_path=persist_path, semantic=False)
+    _summary_keywords_cache = SemanticCache(
+        None, "summary_keywords", persist_path=persist_path, semantic=False
+    )
+
+
 async def summarize_text(text: str, max_sentences: int = 6) -> str:
     """
     Summarize text using LLM.
@@ -141,7 +236,13 @@ async def summarize_text(text: str, max_sentences: int = 6) -> str:
         Summary string
     """
     processor = _get_llm_processor()
-    return await processor.summarize(text, max_sentences)
+    if _summary_cache is None:
+        return await processor.summarize(text, max_sentences)
+    return await _summary_cache.get_or_compute(
+        text,
+        lambda: processor.summarize(text, max_sentences),
+        scope=str(max_sentences),
+    )
 
 
 async def extract_keywords(text: str, num_keywords: int = 10) -> List[str]:
@@ -156,5 +257,42 @@ async def extract_keywords(text: str, num_keywords: int = 10) -> List[str]:
         List of keyword strings
     """
     processor = _get_llm_processor()
-    return await processor.extract_keywords(text, num_keywords)
+    if _keywords_cache is None:
+        return await processor.extract_keywords(text, num_keywords)
+    return await _keywords_cache.get_or_compute(
+        text,
+        lambda: processor.extract_keywords(text, num_keywords),
+        scope=str(num_keywords),
+    )
+
+
+async def summarize_and_extract_keywords(
+    text: str, max_sentences: int = 6, num_keywords: int = 10
+) -> Tuple[str, List[str]]:
+    """
+    Summarize text and extract keywords using a single LLM request.
 
+    Args:
+        text: Text to analyze
+        max_sentences: Maximum number of sentences
+        num_keywords: Number of keywords to extract
+
+    Returns:
+        Tuple of summary string and list of keyword strings
+    """
+    processor = _get_llm_processor()
+    if _summary_keywords_cache is None:
+        return await processor.summarize_and_extract_keywords(
+            text, max_sentences, num_keywords
+        )
+
+    async def compute():
+        summary, keywords = await processor.summarize_and_extract_keywords(
+            text, max_sentences, num_keywords
+        )
+        return {"summary": summary, "keywords": keywords}
+
+    result = await _summary_keywords_cache.get_or_compute(
+        text, compute, scope=f"{max_sentences}:{num_keywords}"
+    )
+    return result["summary"], result["keywords"]
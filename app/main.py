@@ -1,26 +1,42 @@
 """FastAPI main application."""
 
+import asyncio
 import logging
 import os
+import threading
+import uuid
+from contextlib import asynccontextmanager
 from datetime import datetime
+from functools import lru_cache, wraps
 from pathlib import Path
-from typing import List, Optional
+from typing import Any, List, Optional
 
-from fastapi import FastAPI, File, HTTPException, UploadFile, Query
-from fastapi.responses import JSONResponse
+import aiofiles
+import orjson
+from fastapi import Depends, FastAPI, File, HTTPException, UploadFile, Query
+from fastapi.middleware.gzip import GZipMiddleware
+from fastapi.responses import JSONResponse, StreamingResponse
 from pydantic import BaseModel
 
 from app.pdf_extraction import extract_text_from_pdf
-from app.llm_summary import summarize_text, extract_keywords
+from app.llm_summary import summarize_and_extract_keywords, configure_cache
+from app.llm_cache import SemanticCache
 from app.embedder import Embedder
-from app.vector_store import VectorStore
+from app.vector_store import BaseVectorStore, create_vector_store
 from app.query_engine import QueryEngine
 
 # Create necessary directories
 UPLOAD_DIR = Path("uploads")
 UPLOAD_DIR.mkdir(exist_ok=True)
+UPLOAD_CHUNK_SIZE = 1 << 20  # 1 MiB
+MAX_PDF_BYTES = 50 * 1024 * 1024  # 50 MiB
+MAX_UPLOAD_FILES = 20
+# Allowance for multipart boundaries and part headers around the file bytes
+MULTIPART_OVERHEAD_BYTES = 64 * 1024
+MAX_BATCH_QUERIES = 10
 DB_DIR = Path("db/chroma")
 DB_DIR.mkdir(parents=True, exist_ok=True)
+LLM_CACHE_PATH = Path("db/llm_cache.sqlite3")
 LOG_DIR = Path("logs")
 LOG_DIR.mkdir(exist_ok=True)
 
@@ -37,18 +53,138 @@ logging.basicConfig(
 
 logger = logging.getLogger(__name__)
 
+# Components are created lazily on first use so that importing the app (and
+# Uvicorn startup) does not wait for the embedding model to load.
+_init_lock = threading.RLock()
+
+
+def _singleton(factory):
+    """Cache a zero-argument factory, serializing the first call across threads."""
+    cached = lru_cache(maxsize=1)(factory)
+
+    @wraps(factory)
+    def wrapper():
+        with _init_lock:
+            return cached()
+
+    wrapper.cache_info = cached.cache_info
+    return wrapper
+
+
+@_singleton
+def get_embedder() -> Embedder:
+    """Get the shared embedder."""
+    logger.info("Initializing embedder...")
+    embedder = Embedder(backend=os.getenv("EMBEDDING_BACKEND", "torch"))
+    logger.info("Embedder initialized successfully")
+    return embedder
+
+
+@_singleton
+def get_vector_store() -> BaseVectorStore:
+    """Get the shared vector store for the configured backend."""
+    return create_vector_store(get_embedder())
+
+
+@_singleton
+def get_query_engine() -> QueryEngine:
+    """
+    Get the shared query engine.
+
+    Raises:
+        HTTPException: 503 if the LLM client is not configured (e.g. no API key)
+    """
+    embedder = get_embedder()
+    try:
+        return QueryEngine(
+            get_vector_store(),
+            embedder,
+            explanation_cache=SemanticCache(
+                embedder.embed_async, "explanation", persist_path=LLM_CACHE_PATH
+            ),
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=503, detail=f"Search is unavailable: {str(e)}")
+
+
+async def _warm_up():
+    """Load components in a worker thread after the server has started."""
+    try:
+        await asyncio.to_thread(get_vector_store)
+        await asyncio.to_thread(get_query_engine)
+    except HTTPException as e:
+        logger.error(f"Configuration error: {e.detail}")
+    except Exception as e:
+        logger.error(f"Error initializing application components: {str(e)}", exc_info=True)
+
+
+class OrjsonResponse(JSONResponse):
+    """JSON response serialized with orjson, which is faster than the standard json module."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS | orjson.OPT_SERIALIZE_NUMPY)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Warm up components without delaying readiness, and flush the vector store on shutdown."""
+    configure_cache(persist_path=LLM_CACHE_PATH)
+    warm_up_task = asyncio.create_task(_warm_up())
+    yield
+    warm_up_task.cancel()
+    if get_vector_store.cache_info().currsize:
+        await asyncio.to_thread(get_vector_store().flush)
+
+
 app = FastAPI(
     title="Pocket ML Paper RAG API",
     description="Personal LLM-powered ML paper recommendation engine",
     version="0.1.0",
+    lifespan=lifespan,
+    default_response_class=OrjsonResponse,
 )
 
-# Initialize components
-logger.info("Initializing application components...")
-embedder = Embedder()
-vector_store = VectorStore(embedder)
-query_engine = QueryEngine(vector_store, embedder)
-logger.info("Application components initialized successfully")
+class UploadSizeLimitMiddleware:
+    """
+    Reject uploads whose declared Content-Length exceeds the limit.
+
+    Runs before the request body is read, so oversized uploads are refused
+    without being spooled to disk by multipart parsing.
+    """
+
+    def __init__(self, app, limits: dict):
+        """
+        Initialize the middleware.
+
+        Args:
+            app: Wrapped ASGI application
+            limits: Maximum request body size in bytes per path
+        """
+        self.app = app
+        self.limits = limits
+
+    async def __call__(self, scope, receive, send):
+        limit = self.limits.get(scope["path"]) if scope["type"] == "http" else None
+        if limit is not None:
+            content_length = dict(scope["headers"]).get(b"content-length", b"")
+            if content_length.isdigit() and int(content_length) > limit:
+                logger.warning(f"Rejecting upload larger than limit: {int(content_length)} bytes")
+                response = OrjsonResponse({"detail": "Upload too large"}, status_code=413)
+                await response(scope, receive, send)
+                return
+        await self.app(scope, receive, send)
+
+
+app.add_middleware(
+    UploadSizeLimitMiddleware,
+    limits={
+        "/upload_pdf": MAX_PDF_BYTES + MULTIPART_OVERHEAD_BYTES,
+        "/upload_pdfs": (MAX_PDF_BYTES + MULTIPART_OVERHEAD_BYTES) * MAX_UPLOAD_FILES,
+    },
+)
+
+# Compress text-heavy JSON responses (paper listings, search results)
+app.add_middleware(GZipMiddleware, minimum_size=1024)
 
 
 class PaperResponse(BaseModel):
@@ -62,12 +198,18 @@ class PaperResponse(BaseModel):
     metadata: dict
 
 
+class SearchResult(BaseModel):
+    """Response model for one paper found by a search."""
+
+    paper: PaperResponse
+    explanation: str
+
+
 class SearchResponse(BaseModel):
     """Response model for search results."""
 
     query: str
-    papers: List[PaperResponse]
-    explanations: List[str]
+    results: List[SearchResult]
 
 
 @app.get("/")
@@ -78,7 +220,10 @@ async def root():
         "version": "0.1.0",
         "endpoints": {
             "upload": "/upload_pdf",
+            "upload_batch": "/upload_pdfs",
             "search": "/search",
+            "search_stream": "/search_stream",
+            "search_batch": "/search_batch",
             "list_papers": "/papers",
             "get_paper": "/papers/{paper_id}",
             "delete_paper": "/papers/{paper_id}",
@@ -88,18 +233,14 @@ async def root():
 
 
 @app.get("/health")
-async def health():
+async def health(vector_store: BaseVectorStore = Depends(get_vector_store)):
     """Health check endpoint."""
     return {"status": "healthy", "vector_store_ready": vector_store.is_ready()}
 
 
-@app.post("/upload_pdf")
-async def upload_pdf(
-    file: UploadFile = File(...),
-    title: Optional[str] = Query(None, description="Optional paper title override"),
-):
+async def _prepare_pdf(file: UploadFile, title: Optional[str], embedder: Embedder) -> dict:
     """
-    Upload and process a PDF paper.
+    Save and process one uploaded PDF paper, ready to be stored.
 
     Steps:
     1. Extract text from PDF
@@ -107,25 +248,36 @@ async def upload_pdf(
     3. Extract keywords using LLM
     4. Create document representation
     5. Generate embedding
-    6. Store in vector database
+
+    Returns:
+        Keyword arguments of BaseVectorStore.add_paper for the paper
+
+    Raises:
+        HTTPException: If the file is invalid or processing fails
     """
-    logger.info(f"PDF upload request received - filename: {file.filename}, title override: {title}")
-    
     if not file.filename.endswith(".pdf"):
         raise HTTPException(status_code=400, detail="File must be a PDF")
 
     try:
-        # Save uploaded file
-        file_path = UPLOAD_DIR / file.filename
+        # Save uploaded file under a unique name, aborting once it exceeds the size limit
+        file_path = UPLOAD_DIR / f"{uuid.uuid4().hex}_{Path(file.filename).name}"
         logger.debug(f"Saving uploaded file to: {file_path}")
-        with open(file_path, "wb") as f:
-            content = await file.read()
-            f.write(content)
-        logger.debug(f"File saved successfully, size: {len(content)} bytes")
+        total_bytes = 0
+        async with aiofiles.open(file_path, "wb") as f:
+            while chunk := await file.read(UPLOAD_CHUNK_SIZE):
+                total_bytes += len(chunk)
+                if total_bytes > MAX_PDF_BYTES:
+                    break
+                await f.write(chunk)
+        if total_bytes > MAX_PDF_BYTES:
+            file_path.unlink(missing_ok=True)
+            logger.warning(f"Rejecting upload larger than limit: {file.filename}")
+            raise HTTPException(status_code=413, detail="PDF too large")
+        logger.debug(f"File saved successfully, size: {file_path.stat().st_size} bytes")
 
         # Extract text
         logger.debug("Extracting text from PDF...")
-        text = extract_text_from_pdf(file_path)
+        text = await asyncio.to_thread(extract_text_from_pdf, file_path)
         if not text or len(text.strip()) < 100:
             logger.warning(f"Insufficient text extracted from PDF: {len(text) if text else 0} characters")
             raise HTTPException(
@@ -135,8 +287,7 @@ async def upload_pdf(
 
         # Generate summary and keywords
         logger.debug("Generating summary and keywords using LLM...")
-        summary = await summarize_text(text)
-        keywords = await extract_keywords(text)
+        summary, keywords = await summarize_and_extract_keywords(text)
         logger.debug(f"Summary generated ({len(summary)} chars), keywords: {len(keywords)} items")
 
         # Extract title (use provided or extract from text)
@@ -154,32 +305,20 @@ async def upload_pdf(
 
         # Generate embedding
         logger.debug("Generating embedding...")
-        embedding = embedder.embed(doc_text)
+        embedding = await embedder.embed_async(doc_text)
         logger.debug(f"Embedding generated, dimension: {len(embedding)}")
 
-        # Store in vector database
-        logger.debug("Storing paper in vector database...")
-        paper_id = vector_store.add_paper(
-            title=title,
-            summary=summary,
-            keywords=keywords,
-            content_snippet=content_snippet,
-            full_text=text,
-            embedding=embedding,
-            metadata={
-                "filename": file.filename,
-                "file_path": str(file_path),
-            },
-        )
-        logger.info(f"Paper uploaded and processed successfully - paper_id: {paper_id}, title: {title}")
-
         return {
-            "paper_id": paper_id,
             "title": title,
             "summary": summary,
             "keywords": keywords,
             "content_snippet": content_snippet,
-            "message": "Paper uploaded and processed successfully",
+            "full_text_length": len(text),
+            "embedding": embedding,
+            "metadata": {
+                "filename": file.filename,
+                "file_path": str(file_path),
+            },
         }
 
     except HTTPException:
@@ -189,10 +328,100 @@ async def upload_pdf(
         raise HTTPException(status_code=500, detail=f"Error processing PDF: {str(e)}")
 
 
+def _upload_result(paper_id: str, paper: dict) -> dict:
+    """Build the upload response for a stored paper."""
+    return {
+        "paper_id": paper_id,
+        "title": paper["title"],
+        "summary": paper["summary"],
+        "keywords": paper["keywords"],
+        "content_snippet": paper["content_snippet"],
+        "message": "Paper uploaded and processed successfully",
+    }
+
+
+@app.post("/upload_pdf")
+async def upload_pdf(
+    file: UploadFile = File(...),
+    title: Optional[str] = Query(None, description="Optional paper title override"),
+    embedder: Embedder = Depends(get_embedder),
+    vector_store: BaseVectorStore = Depends(get_vector_store),
+):
+    """Upload and process a PDF paper."""
+    logger.info(f"PDF upload request received - filename: {file.filename}, title override: {title}")
+
+    paper = await _prepare_pdf(file, title, embedder)
+
+    # Store in vector database
+    logger.debug("Storing paper in vector database...")
+    try:
+        paper_id = await vector_store.add_paper_async(**paper)
+    except Exception as e:
+        logger.error(f"Error storing paper: {str(e)}", exc_info=True)
+        raise HTTPException(status_code=500, detail=f"Error processing PDF: {str(e)}")
+    logger.info(f"Paper uploaded and processed successfully - paper_id: {paper_id}, title: {paper['title']}")
+
+    return _upload_result(paper_id, paper)
+
+
+@app.post("/upload_pdfs")
+async def upload_pdfs(
+    files: List[UploadFile] = File(...),
+    embedder: Embedder = Depends(get_embedder),
+    vector_store: BaseVectorStore = Depends(get_vector_store),
+):
+    """
+    Upload and process several PDF papers in one request.
+
+    Papers are processed concurrently and a failure only affects its own
+    file; the successfully processed papers are then stored with a single
+    batched write. Returns one result per file, in upload order, holding
+    either the processed paper or an error detail.
+    """
+    logger.info(f"Batch PDF upload request received - files: {len(files)}")
+
+    if len(files) > MAX_UPLOAD_FILES:
+        raise HTTPException(
+            status_code=400, detail=f"At most {MAX_UPLOAD_FILES} files per request"
+        )
+
+    outcomes = await asyncio.gather(
+        *[_prepare_pdf(file, None, embedder) for file in files],
+        return_exceptions=True,
+    )
+
+    papers = [outcome for outcome in outcomes if not isinstance(outcome, Exception)]
+    paper_ids = []
+    store_error = None
+    if papers:
+        logger.debug(f"Storing {len(papers)} papers in vector database...")
+        try:
+            paper_ids = await vector_store.add_papers_batch_async(papers)
+        except Exception as e:
+            logger.error(f"Error storing papers: {str(e)}", exc_info=True)
+            store_error = f"Error processing PDF: {str(e)}"
+    stored = iter(paper_ids)
+
+    results = []
+    for file, outcome in zip(files, outcomes):
+        if isinstance(outcome, HTTPException):
+            results.append({"filename": file.filename, "error": outcome.detail})
+        elif isinstance(outcome, Exception):
+            results.append({"filename": file.filename, "error": f"Error processing PDF: {str(outcome)}"})
+        elif store_error:
+            results.append({"filename": file.filename, "error": store_error})
+        else:
+            results.append({"filename": file.filename, **_upload_result(next(stored), outcome)})
+
+    logger.info(f"Batch PDF upload completed - stored: {len(paper_ids)} of {len(files)}")
+    return {"results": results}
+
+
 @app.get("/search")
 async def search(
     query: str = Query(..., description="Search query"),
     top_k: int = Query(5, ge=1, le=20, description="Number of results to return"),
+    query_engine: QueryEngine = Depends(get_query_engine),
 ):
     """
     Search for similar papers and get LLM explanations.
@@ -210,8 +439,61 @@ async def search(
         raise HTTPException(status_code=500, detail=f"Error searching: {str(e)}")
 
 
+@app.get("/search_stream")
+async def search_stream(
+    query: str = Query(..., description="Search query"),
+    top_k: int = Query(5, ge=1, le=20, description="Number of results to return"),
+    query_engine: QueryEngine = Depends(get_query_engine),
+):
+    """
+    Search for similar papers, streaming each one as its explanation is ready.
+
+    Returns newline-delimited JSON with one {"rank", "paper", "explanation"}
+    object per paper, or a final {"error"} object if the search fails.
+    """
+    if not query or not query.strip():
+        raise HTTPException(status_code=400, detail="Query cannot be empty")
+
+    async def events():
+        try:
+            async for event in query_engine.search_stream(query, top_k=top_k):
+                yield orjson.dumps(event) + b"\n"
+        except Exception as e:
+            logger.error(f"Error streaming search: {str(e)}", exc_info=True)
+            yield orjson.dumps({"error": f"Error searching: {str(e)}"}) + b"\n"
+
+    return StreamingResponse(events(), media_type="application/x-ndjson")
+
+
+@app.get("/search_batch")
+async def search_batch(
+    queries: List[str] = Query(..., description="Search queries"),
+    top_k: int = Query(5, ge=1, le=20, description="Number of results to return per query"),
+    query_engine: QueryEngine = Depends(get_query_engine),
+):
+    """
+    Search for similar papers for several queries at once.
+
+    Returns one search response (query and results) per query.
+    """
+    queries = [q for q in queries if q and q.strip()]
+    if not queries:
+        raise HTTPException(status_code=400, detail="Queries cannot be empty")
+    if len(queries) > MAX_BATCH_QUERIES:
+        raise HTTPException(
+            status_code=400, detail=f"At most {MAX_BATCH_QUERIES} queries per request"
+        )
+
+    try:
+        results = await query_engine.search_batch(queries, top_k=top_k)
+        return {"results": results}
+
+    except Exception as e:
+        raise HTTPException(status_code=500, detail=f"Error searching: {str(e)}")
+
+
 @app.get("/papers/{paper_id}")
-async def get_paper(paper_id: str):
+async def get_paper(paper_id: str, vector_store: BaseVectorStore = Depends(get_vector_store)):
     """Get a specific paper by ID."""
     try:
         paper = vector_store.get_paper(paper_id)
@@ -224,14 +506,18 @@ async def get_paper(paper_id: str):
 
 
 @app.get("/papers")
-async def list_papers():
-    """List all papers in the database."""
-    logger.debug("List papers request received")
+async def list_papers(
+    limit: int = Query(100, ge=1, le=1000, description="Number of papers to return"),
+    offset: int = Query(0, ge=0, description="Number of papers to skip"),
+    vector_store: BaseVectorStore = Depends(get_vector_store),
+):
+    """List one page of papers in the database, with the total paper count."""
+    logger.debug(f"List papers request received - limit: {limit}, offset: {offset}")
     try:
-        papers = vector_store.list_all_papers()
-        count = len(papers)
-        logger.debug(f"List papers completed - count: {count}")
-        return {"papers": papers, "count": count}
+        papers = vector_store.list_all_papers(limit=limit, offset=offset)
+        total = vector_store.count()
+        logger.debug(f"List papers completed - returned: {len(papers)}, total: {total}")
+        return {"papers": papers, "total": total}
 
     except Exception as e:
         logger.error(f"Error listing papers: {str(e)}", exc_info=True)
@@ -239,7 +525,7 @@ async def list_papers():
 
 
 @app.delete("/papers/{paper_id}")
-async def delete_paper(paper_id: str):
+async def delete_paper(paper_id: str, vector_store: BaseVectorStore = Depends(get_vector_store)):
     """Delete a paper by ID."""
     logger.info(f"Delete paper request - paper_id: {paper_id}")
     try:
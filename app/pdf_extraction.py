@@ -1,19 +1,36 @@
 """PDF text extraction module."""
 
+import re
+from io import StringIO
 from pathlib import Path
 from typing import Optional
 
-from pdfminer.high_level import extract_text as pdfminer_extract
+from pdfminer.converter import TextConverter
 from pdfminer.layout import LAParams
+from pdfminer.pdfinterp import PDFPageInterpreter, PDFResourceManager
+from pdfminer.pdfpage import PDFPage
 
+# Line break plus surrounding whitespace; the lookbehind anchors matches at the
+# start of a whitespace run so long runs without a newline are not rescanned
+_LINE_BREAK_RE = re.compile(r"(?<![^\S\n])[^\S\n]*\n\s*")
+_MULTI_SPACE_RE = re.compile(r" {2,}")
 
-def extract_text_from_pdf(pdf_path: Path, max_chars: Optional[int] = None) -> str:
+
+def extract_text_from_pdf(
+    pdf_path: Path,
+    max_chars: Optional[int] = None,
+    max_pages: Optional[int] = None,
+) -> str:
     """
     Extract text from a PDF file.
 
+    Pages are parsed one at a time, so extraction stops early once
+    ``max_chars`` characters or ``max_pages`` pages have been read.
+
     Args:
         pdf_path: Path to the PDF file
         max_chars: Optional maximum number of characters to extract
+        max_pages: Optional maximum number of pages to parse
 
     Returns:
         Extracted text as a string
@@ -27,7 +44,25 @@ def extract_text_from_pdf(pdf_path: Path, max_chars: Optional[int] = None) -> st
             boxes_flow=0.5,
         )
 
-        text = pdfminer_extract(str(pdf_path), laparams=laparams)
+        with open(pdf_path, "rb") as fp, StringIO() as output:
+            resource_manager = PDFResourceManager(caching=True)
+            device = TextConverter(resource_manager, output, laparams=laparams)
+            interpreter = PDFPageInterpreter(resource_manager, device)
+
+            for page_number, page in enumerate(PDFPage.get_pages(fp, caching=True), 1):
+                interpreter.process_page(page)
+                if max_pages and page_number >= max_pages:
+                    break
+                # Cleaning only shrinks text, so check the raw length first
+                if (
+                    max_chars
+                    and output.tell() >= max_chars
+                    and len(_clean_text(output.getvalue())) >= max_chars
+                ):
+                    break
+
+            device.close()
+            text = output.getvalue()
 
         # Clean and normalize text
         text = _clean_text(text)
@@ -52,20 +87,11 @@ def _clean_text(text: str) -> str:
     Returns:
         Cleaned text
     """
-    # Remove excessive whitespace
-    lines = text.split("\n")
-    cleaned_lines = []
-    for line in lines:
-        line = line.strip()
-        if line:
-            cleaned_lines.append(line)
-
-    # Join with single newlines
-    text = "\n".join(cleaned_lines)
+    # Strip every line and drop blank ones, joining with single newlines
+    text = _LINE_BREAK_RE.sub("\n", text).strip()
 
     # Remove excessive spaces
-    while "  " in text:
-        text = text.replace("  ", " ")
+    text = _MULTI_SPACE_RE.sub(" ", text)
 
     return text
 
@@ -1,34 +1,57 @@
 """Query engine for searching papers and generating explanations."""
 
+import asyncio
 import os
-from typing import List, Dict, Any
+from collections import OrderedDict
+from typing import AsyncIterator, List, Dict, Any, Optional
 
-from openai import OpenAI
+import numpy as np
+from openai import AsyncOpenAI
 
 from app.embedder import Embedder
-from app.vector_store import VectorStore
+from app.llm_cache import SemanticCache
+from app.vector_store import BaseVectorStore
+
+# Maximum number of concurrent explanation requests to the LLM
+MAX_CONCURRENT_EXPLANATIONS = 8
+
+# Maximum number of query embeddings kept in the LRU cache
+QUERY_EMBEDDING_CACHE_SIZE = 1024
+
+FALLBACK_EXPLANATION = (
+    "This paper is relevant because it matches keywords and topics from your query."
+)
 
 
 class QueryEngine:
     """Engine for querying papers and generating LLM explanations."""
 
-    def __init__(self, vector_store: VectorStore, embedder: Embedder):
+    def __init__(
+        self,
+        vector_store: BaseVectorStore,
+        embedder: Embedder,
+        explanation_cache: Optional[SemanticCache] = None,
+    ):
         """
         Initialize the query engine.
 
         Args:
             vector_store: Vector store instance
             embedder: Embedder instance
+            explanation_cache: Optional cache of explanations, scoped per paper
         """
         self.vector_store = vector_store
         self.embedder = embedder
+        self.explanation_cache = explanation_cache
 
         # Initialize LLM client for explanations
         api_key = os.getenv("OPENAI_API_KEY")
         if not api_key:
             raise ValueError("OPENAI_API_KEY environment variable not set")
-        self.llm_client = OpenAI(api_key=api_key)
+        self.llm_client = AsyncOpenAI(api_key=api_key)
         self.model = "gpt-4o-mini"
+        self._semaphore = asyncio.Semaphore(MAX_CONCURRENT_EXPLANATIONS)
+        self._query_embeddings: "OrderedDict[str, np.ndarray]" = OrderedDict()
 
     async def search(
         self, query: str, top_k: int = 5
@@ -41,61 +64,241 @@ class QueryEngine:
             top_k: Number of results to return
 
         Returns:
-            Dictionary with query, papers, and explanations
+            Dictionary with the query and a list of {"paper", "explanation"} results
         """
         # Embed the query
-        query_embedding = self.embedder.embed(query)
+        query_embedding = await self._embed_query(query)
+
+        # Search vector store
+        results = await self.vector_store.search_async(query_embedding, top_k=top_k)
+
+        return await self._build_response(query, query_embedding, results)
+
+    async def search_stream(
+        self, query: str, top_k: int = 5
+    ) -> AsyncIterator[Dict[str, Any]]:
+        """
+        Search for similar papers, yielding each one once its explanation is ready.
+
+        Args:
+            query: Search query string
+            top_k: Number of results to return
+
+        Yields:
+            Dictionaries with the paper's rank, the paper, and its explanation,
+            in the order the explanations complete
+        """
+        query_embedding = await self._embed_query(query)
+        results = await self.vector_store.search_async(query_embedding, top_k=top_k)
+        papers = self._format_papers(results)
+
+        async def explain(rank: int, paper: Dict[str, Any]) -> Dict[str, Any]:
+            try:
+                explanation = await self._explain_one(query, paper, query_embedding)
+            except Exception:
+                # Fallback explanation if LLM fails
+                explanation = FALLBACK_EXPLANATION
+            return {"rank": rank, "paper": paper, "explanation": explanation}
+
+        for event in asyncio.as_completed(
+            [explain(rank, paper) for rank, paper in enumerate(papers)]
+        ):
+            yield await event
+
+    async def search_batch(
+        self, queries: List[str], top_k: int = 5
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for similar papers for several queries with one vector store call.
+
+        Args:
+            queries: Search query strings
+            top_k: Number of results to return per query
+
+        Returns:
+            List of dictionaries with the query and its results, in query order
+        """
+        query_embeddings = await asyncio.gather(*[self._embed_query(q) for q in queries])
 
         # Search vector store
-        results = self.vector_store.search(query_embedding, top_k=top_k)
+        batch_results = await self.vector_store.search_batch_async(
+            list(query_embeddings), top_k=top_k
+        )
+
+        return await asyncio.gather(
+            *[
+                self._build_response(query, query_embedding, results)
+                for query, query_embedding, results in zip(queries, query_embeddings, batch_results)
+            ]
+        )
+
+    async def _build_response(
+        self, query: str, query_embedding: np.ndarray, results: List[Dict[str, Any]]
+    ) -> Dict[str, Any]:
+        """
+        Format vector store results and generate their explanations.
+
+        Args:
+            query: Search query string
+            query_embedding: Embedding of the query
+            results: Vector store results for the query
+
+        Returns:
+            Dictionary with the query and a list of {"paper", "explanation"} results
+        """
+        papers = self._format_papers(results)
+
+        # Generate explanations
+        explanations = await self._generate_explanations(query, papers, query_embedding)
+
+        return {
+            "query": query,
+            "results": [
+                {"paper": paper, "explanation": explanation}
+                for paper, explanation in zip(papers, explanations)
+            ],
+        }
+
+    @staticmethod
+    def _format_papers(results: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """
+        Format vector store results as papers with similarity scores.
+
+        Args:
+            results: Vector store results for a query
+
+        Returns:
+            List of paper dictionaries
+        """
+        # Convert distances to similarities in one vectorized pass
+        distances = np.fromiter(
+            (result.get("distance") or 0.0 for result in results),
+            dtype=np.float32,
+            count=len(results),
+        )
+        similarities = 1.0 - distances
 
         # Format papers
         papers = []
-        for result in results:
+        for result, similarity in zip(results, similarities):
             metadata = result.get("metadata", {})
+            keywords = metadata.get("keywords")
             paper = {
                 "id": result.get("id"),
                 "title": metadata.get("title", "Unknown"),
                 "summary": metadata.get("summary", ""),
-                "keywords": metadata.get("keywords", "").split(",")
-                if metadata.get("keywords")
-                else [],
+                "keywords": keywords.split(",") if keywords else [],
                 "content_snippet": metadata.get("content_snippet", ""),
                 "metadata": metadata,
-                "similarity_score": 1.0 - result.get("distance", 0.0),  # Convert distance to similarity
+                "similarity_score": float(similarity),
             }
             papers.append(paper)
 
-        # Generate explanations
-        explanations = await self._generate_explanations(query, papers)
+        return papers
 
-        return {
-            "query": query,
-            "papers": papers,
-            "explanations": explanations,
-        }
+    async def _embed_query(self, query: str) -> np.ndarray:
+        """
+        Embed a query, reusing the embedding of recently seen queries.
+
+        The cache key is the stripped, lowercased query; the default MiniLM
+        model is uncased, so this does not change the embedding.
+
+        Args:
+            query: Search query string
+
+        Returns:
+            Query embedding as a float32 array
+        """
+        key = query.strip().lower()
+        embedding = self._query_embeddings.get(key)
+        if embedding is not None:
+            self._query_embeddings.move_to_end(key)
+            return embedding
+
+        embedding = np.asarray(await self.embedder.embed_async(key), dtype=np.float32)
+        self._query_embeddings[key] = embedding
+        if len(self._query_embeddings) > QUERY_EMBEDDING_CACHE_SIZE:
+            self._query_embeddings.popitem(last=False)
+        return embedding
 
     async def _generate_explanations(
-        self, query: str, papers: List[Dict[str, Any]]
+        self,
+        query: str,
+        papers: List[Dict[str, Any]],
+        query_embedding: Optional[np.ndarray] = None,
     ) -> List[str]:
         """
         Generate LLM explanations for why each paper is relevant.
 
+        Explanations are requested concurrently, bounded by the engine's
+        semaphore to stay within API rate limits.
+
         Args:
             query: Original search query
             papers: List of paper dictionaries
+            query_embedding: Embedding of the query, reused for cache lookups
 
         Returns:
             List of explanation strings
         """
+        results = await asyncio.gather(
+            *[self._explain_one(query, paper, query_embedding) for paper in papers],
+            return_exceptions=True,
+        )
+
         explanations = []
+        for result in results:
+            if isinstance(result, Exception):
+                # Fallback explanation if LLM fails
+                explanations.append(FALLBACK_EXPLANATION)
+            else:
+                explanations.append(result)
+
+        return explanations
+
+    async def _explain_one(
+        self,
+        query: str,
+        paper: Dict[str, Any],
+        query_embedding: Optional[np.ndarray] = None,
+    ) -> str:
+        """
+        Generate an LLM explanation for a single paper, using the cache if set.
+
+        Args:
+            query: Original search query
+            paper: Paper dictionary
+            query_embedding: Embedding of the query, reused for cache lookups
+
+        Returns:
+            Explanation string
+        """
+        if self.explanation_cache is None:
+            return await self._request_explanation(query, paper)
+        return await self.explanation_cache.get_or_compute(
+            query,
+            lambda: self._request_explanation(query, paper),
+            scope=paper.get("id") or "",
+            embedding=query_embedding,
+        )
 
-        for paper in papers:
-            title = paper.get("title", "Unknown")
-            summary = paper.get("summary", "")
-            keywords = ", ".join(paper.get("keywords", []))
+    async def _request_explanation(self, query: str, paper: Dict[str, Any]) -> str:
+        """
+        Request an explanation for a single paper from the LLM.
+
+        Args:
+            query: Original search query
+            paper: Paper dictionary
 
-            prompt = f"""Given the user query "{query}", explain in 1-2 sentences why this research paper is relevant:
+        Returns:
+            Explanation string
+        """
+        title = paper.get("title", "Unknown")
+        summary = paper.get("summary", "")
+        # Reuse the comma-joined keywords as stored rather than re-joining the list
+        keywords = paper.get("metadata", {}).get("keywords") or ""
+
+        prompt = f"""Given the user query "{query}", explain in 1-2 sentences why this research paper is relevant:
 
 Title: {title}
 Summary: {summary}
@@ -103,28 +306,18 @@ Keywords: {keywords}
 
 Explanation:"""
 
-            try:
-                response = self.llm_client.chat.completions.create(
-                    model=self.model,
-                    messages=[
-                        {
-                            "role": "system",
-                            "content": "You are an expert at explaining why research papers are relevant to queries. Be concise and specific.",
-                        },
-                        {"role": "user", "content": prompt},
-                    ],
-                    temperature=0.3,
-                    max_tokens=150,
-                )
-
-                explanation = response.choices[0].message.content.strip()
-                explanations.append(explanation)
-
-            except Exception as e:
-                # Fallback explanation if LLM fails
-                explanations.append(
-                    f"This paper is relevant because it matches keywords and topics from your query."
-                )
-
-        return explanations
+        async with self._semaphore:
+            response = await self.llm_client.chat.completions.create(
+                model=self.model,
+                messages=[
+                    {
+                        "role": "system",
+                        "content": "You are an expert at explaining why research papers are relevant to queries. Be concise and specific.",
+                    },
+                    {"role": "user", "content": prompt},
+                ],
+                temperature=0.3,
+                max_tokens=150,
+            )
 
+        return response.choices[0].message.content.strip()
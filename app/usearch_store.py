@@ -0,0 +1,223 @@
+"""Vector database integration using USearch."""
+
+import json
+import threading
+from itertools import islice
+from pathlib import Path
+from typing import Any, Dict, List, Literal, Optional
+
+import numpy as np
+from usearch.index import Index
+
+from app.vector_store import BaseVectorStore
+
+# Seconds between a change and the write of the index and metadata to disk
+PERSIST_INTERVAL_SECONDS = 5.0
+
+
+class USearchVectorStore(BaseVectorStore):
+    """
+    Vector store for paper embeddings using a USearch HNSW index.
+
+    The index uses USearch's SIMD cosine kernels. Paper metadata is kept in
+    memory and persisted next to the index as JSON. Changes are written out
+    at most every ``persist_interval`` seconds and on ``flush``, so a burst of
+    adds or deletes costs one save. Metadata filters support exact-match
+    conditions only.
+    """
+
+    def __init__(
+        self,
+        embedder,
+        persist_directory: str = "db/usearch",
+        connectivity: int = 24,
+        expansion_add: int = 128,
+        expansion_search: int = 100,
+        quantization: Literal["f32", "f16", "i8"] = "f32",
+        persist_interval: float = PERSIST_INTERVAL_SECONDS,
+    ):
+        """
+        Initialize the vector store.
+
+        Args:
+            embedder: Embedder instance for generating embeddings
+            persist_directory: Directory to persist the index and metadata
+            connectivity: Maximum number of neighbors per node in the HNSW graph
+            expansion_add: Candidate list size when building the graph
+            expansion_search: Candidate list size when searching the graph
+            quantization: Scalar type of stored vectors. "f16" halves and "i8"
+                quarters memory versus "f32", with little recall loss on
+                normalized embeddings. Changing it requires rebuilding the index.
+            persist_interval: Seconds between a change and its write to disk
+        """
+        super().__init__(embedder)
+        self.persist_directory = Path(persist_directory)
+        self.persist_directory.mkdir(parents=True, exist_ok=True)
+        self.index_path = self.persist_directory / "index.usearch"
+        self.papers_path = self.persist_directory / "papers.json"
+
+        self.index = Index(
+            ndim=embedder.get_embedding_dim(),
+            metric="cos",
+            dtype=quantization,
+            connectivity=connectivity,
+            expansion_add=expansion_add,
+            expansion_search=expansion_search,
+        )
+
+        # Integer index keys map to paper records ({"id", "metadata"})
+        self._papers: Dict[int, Dict[str, Any]] = {}
+        self._keys: Dict[str, int] = {}
+        self._lock = threading.Lock()
+        self.persist_interval = persist_interval
+        self._dirty = False
+        self._flush_timer: Optional[threading.Timer] = None
+
+        if self.index_path.exists() and self.papers_path.exists():
+            self.index.load(str(self.index_path))
+            with open(self.papers_path, encoding="utf-8") as f:
+                for key, paper in json.load(f).items():
+                    # Records written before snippets moved into the metadata
+                    paper.pop("document", None)
+                    self._papers[int(key)] = paper
+                    self._keys[paper["id"]] = int(key)
+
+        self._next_key = max(self._papers, default=-1) + 1
+
+    def _persist(self) -> None:
+        """Save the index and paper metadata to disk."""
+        self.index.save(str(self.index_path))
+        with open(self.papers_path, "w", encoding="utf-8") as f:
+            json.dump(self._papers, f)
+
+    def _mark_dirty(self) -> None:
+        """Schedule a flush for unsaved changes (called with the lock held)."""
+        self._dirty = True
+        if self._flush_timer is None:
+            self._flush_timer = threading.Timer(self.persist_interval, self.flush)
+            self._flush_timer.daemon = True
+            self._flush_timer.start()
+
+    def flush(self) -> None:
+        """Write unsaved changes to disk."""
+        with self._lock:
+            if self._flush_timer is not None:
+                self._flush_timer.cancel()
+                self._flush_timer = None
+            if self._dirty:
+                self._persist()
+                self._dirty = False
+
+    def is_ready(self) -> bool:
+        """Check if vector store is ready."""
+        return self.index is not None
+
+    def _add_records(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Add built records to the USearch index."""
+        with self._lock:
+            keys = np.arange(self._next_key, self._next_key + len(ids), dtype=np.uint64)
+            self.index.add(keys, embeddings)
+            for key, paper_id, metadata in zip(keys.tolist(), ids, metadatas):
+                self._papers[key] = {"id": paper_id, "metadata": metadata}
+                self._keys[paper_id] = key
+            self._next_key += len(ids)
+            self._mark_dirty()
+
+    def _search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 5,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the USearch index for similar papers.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results to return
+            filter_metadata: Optional exact-match metadata filters
+
+        Returns:
+            List of result dictionaries with id, distance, and metadata
+        """
+        if not self._papers:
+            return []
+
+        # With a filter, rank every paper and keep the first top_k matches
+        count = len(self._papers) if filter_metadata else min(top_k, len(self._papers))
+        matches = self.index.search(np.asarray(query_embedding, dtype=np.float32), count)
+
+        formatted_results = []
+        for key, distance in zip(matches.keys.tolist(), matches.distances.tolist()):
+            paper = self._papers.get(key)
+            if paper is None:
+                continue
+            if filter_metadata and any(
+                paper["metadata"].get(k) != v for k, v in filter_metadata.items()
+            ):
+                continue
+            formatted_results.append({**paper, "distance": distance})
+            if len(formatted_results) >= top_k:
+                break
+
+        return formatted_results
+
+    def get_paper(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        """
+        Get a paper by ID.
+
+        Args:
+            paper_id: Paper ID
+
+        Returns:
+            Paper data dictionary or None if not found
+        """
+        with self._lock:
+            key = self._keys.get(paper_id)
+            if key is None:
+                return None
+            return dict(self._papers[key])
+
+    def list_all_papers(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """
+        List one page of papers in the database.
+
+        Args:
+            limit: Maximum number of papers to return
+            offset: Number of papers to skip
+
+        Returns:
+            List of paper dictionaries
+        """
+        with self._lock:
+            return [dict(paper) for paper in islice(self._papers.values(), offset, offset + limit)]
+
+    def _delete_paper(self, paper_id: str) -> bool:
+        """
+        Delete a paper from the USearch index.
+
+        Args:
+            paper_id: Paper ID
+
+        Returns:
+            True if deleted, False otherwise
+        """
+        try:
+            with self._lock:
+                key = self._keys.pop(paper_id, None)
+                if key is not None:
+                    self.index.remove(key)
+                    del self._papers[key]
+                    self._mark_dirty()
+            return True
+        except Exception:
+            return False
+
+    def count(self) -> int:
+        """Get the number of papers in the database."""
+        return len(self._papers)
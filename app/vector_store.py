@@ -1,98 +1,376 @@
-"""Vector database integration using Chroma."""
-
+"""Vector database integration using Chroma (default) or USearch."""
+
+import asyncio
+import json
+import logging
+import os
+import sqlite3
+import threading
 import uuid
+from abc import ABC, abstractmethod
+from contextlib import closing
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, List, Optional, Any
+from typing import Dict, List, Optional, Any, Tuple
 
 import chromadb
 from chromadb.config import Settings
 import numpy as np
 
+logger = logging.getLogger(__name__)
 
-class VectorStore:
-    """Vector store for paper embeddings using Chroma."""
+# Maximum number of concurrent writes issued through add_paper_async
+MAX_CONCURRENT_WRITES = 4
+
+# Maximum number of keywords stored per paper
+MAX_STORED_KEYWORDS = 50
+
+# Maximum number of search results kept in the LRU cache
+SEARCH_CACHE_SIZE = 256
+
+# Collections below this size are searched by exact brute-force scan
+BRUTE_FORCE_MAX_PAPERS = 50_000
+
+# Number of papers read per page when loading the brute-force embedding matrix
+MIRROR_LOAD_PAGE_SIZE = 1000
+
+# Memory budget for Chroma's LRU cache of loaded index segments
+SEGMENT_CACHE_BYTES = 2 * 1024**3
+
+
+def _is_exact_match_filter(filter_metadata: Dict[str, Any]) -> bool:
+    """Check whether a metadata filter only holds plain ``{key: value}`` equalities."""
+    return all(
+        not key.startswith("$") and isinstance(value, (str, int, float, bool))
+        for key, value in filter_metadata.items()
+    )
+
+
+def _chroma_where(filter_metadata: Optional[Dict[str, Any]]) -> Optional[Dict[str, Any]]:
+    """
+    Convert a metadata filter into a Chroma where clause.
+
+    Chroma accepts a single condition per where clause, so a filter with
+    several ``{key: value}`` equalities is combined with ``$and``.
+    """
+    if not filter_metadata or len(filter_metadata) == 1:
+        return filter_metadata
+    if not _is_exact_match_filter(filter_metadata):
+        return filter_metadata
+    return {"$and": [{key: value} for key, value in filter_metadata.items()]}
+
+
+class _EmbeddingMatrix:
+    """
+    In-memory (N, D) float32 matrix of normalized embeddings for exact search.
+
+    Rows are stored in a growable buffer; deleting a row moves the last row
+    into its place. Similarity scores are written into a preallocated buffer
+    by a single BLAS matrix-vector product. Each row keeps its metadata
+    dictionary so results are served without a round trip to the store, and
+    metadata values are also mirrored column-wise (one object array per key,
+    referencing the same values) so exact-match filters are evaluated as
+    NumPy masks.
+    """
+
+    def __init__(self, dim: int):
+        self._buffer = np.empty((16, dim), dtype=np.float32)
+        self._scores = np.empty(16, dtype=np.float32)
+        self._columns: Dict[str, np.ndarray] = {}
+        self._metadatas: List[Dict[str, Any]] = []
+        self._ids: List[str] = []
+        self._rows: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self._ids)
+
+    def add(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        metadatas: Optional[List[Dict[str, Any]]] = None,
+    ) -> None:
+        """Append rows, normalizing them so dot products are cosine similarities."""
+        embeddings = np.asarray(embeddings, dtype=np.float32).reshape(len(ids), -1)
+        norms = np.linalg.norm(embeddings, axis=1, keepdims=True)
+        embeddings = embeddings / np.maximum(norms, 1e-12)
+        metadatas = [metadata or {} for metadata in metadatas] if metadatas else [{}] * len(ids)
+
+        n = len(self._ids)
+        if n + len(ids) > self._buffer.shape[0]:
+            capacity = max(2 * self._buffer.shape[0], n + len(ids))
+            buffer = np.empty((capacity, self._buffer.shape[1]), dtype=np.float32)
+            buffer[:n] = self._buffer[:n]
+            self._buffer = buffer
+            self._scores = np.empty(capacity, dtype=np.float32)
+            for key, column in self._columns.items():
+                grown = np.full(capacity, None, dtype=object)
+                grown[:n] = column[:n]
+                self._columns[key] = grown
+
+        self._buffer[n : n + len(ids)] = embeddings
+        for column in self._columns.values():
+            column[n : n + len(ids)] = None
+        for offset, metadata in enumerate(metadatas):
+            for key, value in metadata.items():
+                column = self._columns.get(key)
+                if column is None:
+                    column = np.full(self._buffer.shape[0], None, dtype=object)
+                    self._columns[key] = column
+                column[n + offset] = value
+
+        for offset, paper_id in enumerate(ids):
+            self._rows[paper_id] = n + offset
+            self._ids.append(paper_id)
+        self._metadatas.extend(metadatas)
+
+    def remove(self, paper_id: str) -> None:
+        """Remove a row if present."""
+        row = self._rows.pop(paper_id, None)
+        if row is None:
+            return
+        last = len(self._ids) - 1
+        if row != last:
+            self._buffer[row] = self._buffer[last]
+            for column in self._columns.values():
+                column[row] = column[last]
+            self._metadatas[row] = self._metadatas[last]
+            moved_id = self._ids[last]
+            self._ids[row] = moved_id
+            self._rows[moved_id] = row
+        self._ids.pop()
+        self._metadatas.pop()
+
+    def _filter_mask(self, n: int, filter_metadata: Dict[str, Any]) -> np.ndarray:
+        """Boolean mask of the rows matching every exact-match condition."""
+        mask = np.ones(n, dtype=bool)
+        for key, value in filter_metadata.items():
+            column = self._columns.get(key)
+            if column is None:
+                return np.zeros(n, dtype=bool)
+            mask &= column[:n] == value
+        return mask
+
+    def top_k(
+        self,
+        query: np.ndarray,
+        k: int,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[Tuple[str, float, Dict[str, Any]]]:
+        """
+        Find the k rows most similar to a query.
 
-    def __init__(self, embedder, persist_directory: str = "db/chroma"):
+        Args:
+            query: Query embedding vector
+            k: Number of results to return
+            filter_metadata: Optional exact-match metadata filters
+
+        Returns:
+            List of (paper ID, cosine similarity, metadata), most similar first
         """
-        Initialize the vector store.
+        n = len(self._ids)
+        mask = self._filter_mask(n, filter_metadata) if filter_metadata else None
+        k = min(k, n if mask is None else int(np.count_nonzero(mask)))
+        if k == 0:
+            return []
+
+        query = np.asarray(query, dtype=np.float32)
+        query = query / max(float(np.linalg.norm(query)), 1e-12)
+        scores = np.matmul(self._buffer[:n], query, out=self._scores[:n])
+        if mask is not None:
+            scores[~mask] = -np.inf
+
+        top = np.argpartition(-scores, k - 1)[:k]
+        top = top[np.argsort(-scores[top])]
+        return [(self._ids[i], float(scores[i]), dict(self._metadatas[i])) for i in top]
+
+
+class BaseVectorStore(ABC):
+    """
+    Common interface and shared logic for paper vector store backends.
+
+    Subclasses implement the abstract storage operations (``_add_records``,
+    ``_search``, ``_delete_paper``, ``get_paper``, ``list_all_papers``,
+    ``count`` and ``is_ready``).
+    """
+
+    def __init__(self, embedder):
+        """
+        Initialize the shared state.
 
         Args:
             embedder: Embedder instance for generating embeddings
-            persist_directory: Directory to persist Chroma database
         """
         self.embedder = embedder
-        self.persist_directory = Path(persist_directory)
-        self.persist_directory.mkdir(parents=True, exist_ok=True)
+        self._write_semaphore = asyncio.Semaphore(MAX_CONCURRENT_WRITES)
 
-        # Initialize Chroma client
-        self.client = chromadb.PersistentClient(
-            path=str(self.persist_directory),
-            settings=Settings(anonymized_telemetry=False),
-        )
-
-        # Get or create collection
-        self.collection = self.client.get_or_create_collection(
-            name="ml_papers",
-            metadata={"hnsw:space": "cosine"},  # Use cosine similarity
-        )
+        # Search results are cached per generation; mutations bump the generation
+        self._generation = 0
+        self._cached_search = lru_cache(maxsize=SEARCH_CACHE_SIZE)(self._search_by_key)
 
+    @abstractmethod
     def is_ready(self) -> bool:
         """Check if vector store is ready."""
-        try:
-            return self.collection is not None
-        except Exception:
-            return False
 
-    def add_paper(
-        self,
+    @staticmethod
+    def _build_record(
         title: str,
         summary: str,
         keywords: List[str],
         content_snippet: str,
-        full_text: str,
+        full_text_length: int,
         embedding: np.ndarray,
         metadata: Optional[Dict[str, Any]] = None,
-    ) -> str:
+    ) -> Tuple[str, np.ndarray, Dict[str, Any]]:
         """
-        Add a paper to the vector store.
+        Build the stored record for a paper.
+
+        The content snippet is stored only in the metadata.
 
         Args:
             title: Paper title
             summary: Paper summary
             keywords: List of keywords
             content_snippet: Content snippet
-            full_text: Full text of the paper
+            full_text_length: Length of the paper's full text in characters
             embedding: Embedding vector
             metadata: Additional metadata
 
         Returns:
-            Paper ID (UUID string)
+            Tuple of paper ID, float32 embedding and metadata
         """
         paper_id = str(uuid.uuid4())
 
-        # Prepare metadata
+        # Prepare metadata (keywords are bounded to respect metadata size limits)
         paper_metadata = {
             "title": title,
             "summary": summary,
-            "keywords": ",".join(keywords),
+            "keywords": ",".join(keywords[:MAX_STORED_KEYWORDS]),
             "content_snippet": content_snippet,
-            "full_text_length": len(full_text),
-            **(metadata or {}),
+            "full_text_length": full_text_length,
         }
+        if metadata:
+            paper_metadata.update(metadata)
+
+        # Keep a contiguous float32 array; the in-memory matrix and USearch copy it directly
+        embedding = np.ascontiguousarray(embedding, dtype=np.float32)
 
-        # Convert embedding to list
-        embedding_list = embedding.tolist() if isinstance(embedding, np.ndarray) else embedding
+        return paper_id, embedding, paper_metadata
 
-        # Add to collection
-        self.collection.add(
-            ids=[paper_id],
-            embeddings=[embedding_list],
-            metadatas=[paper_metadata],
-            documents=[content_snippet],  # Store snippet as document
+    def add_paper(
+        self,
+        title: str,
+        summary: str,
+        keywords: List[str],
+        content_snippet: str,
+        full_text_length: int,
+        embedding: np.ndarray,
+        metadata: Optional[Dict[str, Any]] = None,
+    ) -> str:
+        """
+        Add a paper to the vector store.
+
+        Args:
+            title: Paper title
+            summary: Paper summary
+            keywords: List of keywords
+            content_snippet: Content snippet
+            full_text_length: Length of the paper's full text in characters
+            embedding: Embedding vector
+            metadata: Additional metadata
+
+        Returns:
+            Paper ID (UUID string)
+        """
+        paper_id, embedding, paper_metadata = self._build_record(
+            title=title,
+            summary=summary,
+            keywords=keywords,
+            content_snippet=content_snippet,
+            full_text_length=full_text_length,
+            embedding=embedding,
+            metadata=metadata,
         )
 
+        self._add_records([paper_id], embedding[None, :], [paper_metadata])
+        self._generation += 1
+
         return paper_id
 
+    async def add_paper_async(self, **kwargs: Any) -> str:
+        """
+        Add a paper without blocking the event loop.
+
+        Runs add_paper in a worker thread, with at most MAX_CONCURRENT_WRITES
+        writes in flight.
+
+        Args:
+            **kwargs: Keyword arguments of add_paper
+
+        Returns:
+            Paper ID (UUID string)
+        """
+        async with self._write_semaphore:
+            return await asyncio.to_thread(self.add_paper, **kwargs)
+
+    def add_papers_batch(
+        self, papers: List[Dict[str, Any]], batch_size: int = 64
+    ) -> List[str]:
+        """
+        Add several papers to the vector store, one write per batch.
+
+        Args:
+            papers: List of dictionaries with the keyword arguments of add_paper
+            batch_size: Number of papers written per storage call
+
+        Returns:
+            List of paper IDs, in the same order as papers
+        """
+        paper_ids = []
+        for start in range(0, len(papers), batch_size):
+            records = [self._build_record(**paper) for paper in papers[start : start + batch_size]]
+            ids, embeddings, metadatas = (list(column) for column in zip(*records))
+            self._add_records(ids, np.vstack(embeddings), metadatas)
+            self._generation += 1
+            paper_ids.extend(ids)
+
+        return paper_ids
+
+    async def add_papers_batch_async(
+        self, papers: List[Dict[str, Any]], batch_size: int = 64
+    ) -> List[str]:
+        """
+        Add several papers without blocking the event loop.
+
+        Runs add_papers_batch in a worker thread, sharing the write limit of
+        add_paper_async.
+
+        Args:
+            papers: List of dictionaries with the keyword arguments of add_paper
+            batch_size: Number of papers written per storage call
+
+        Returns:
+            List of paper IDs, in the same order as papers
+        """
+        async with self._write_semaphore:
+            return await asyncio.to_thread(self.add_papers_batch, papers, batch_size)
+
+    @abstractmethod
+    def _add_records(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """
+        Write built records to the backend.
+
+        Args:
+            ids: Paper IDs
+            embeddings: Float32 embedding matrix with one row per paper
+            metadatas: Paper metadata dictionaries
+        """
+
     def search(
         self,
         query_embedding: np.ndarray,
@@ -100,7 +378,7 @@ class VectorStore:
         filter_metadata: Optional[Dict[str, Any]] = None,
     ) -> List[Dict[str, Any]]:
         """
-        Search for similar papers.
+        Search for similar papers, reusing cached results for repeated queries.
 
         Args:
             query_embedding: Query embedding vector
@@ -110,32 +388,388 @@ class VectorStore:
         Returns:
             List of result dictionaries with id, distance, and metadata
         """
-        query_embedding_list = (
-            query_embedding.tolist()
-            if isinstance(query_embedding, np.ndarray)
-            else query_embedding
+        query = np.ascontiguousarray(query_embedding, dtype=np.float32)
+        filter_key = json.dumps(filter_metadata, sort_keys=True) if filter_metadata else None
+        results = self._cached_search(query.tobytes(), top_k, filter_key, self._generation)
+        return [dict(result) for result in results]
+
+    def _search_by_key(
+        self, query_bytes: bytes, top_k: int, filter_key: Optional[str], generation: int
+    ) -> Tuple[Dict[str, Any], ...]:
+        """Run an uncached search from the hashable cache key."""
+        query_embedding = np.frombuffer(query_bytes, dtype=np.float32)
+        filter_metadata = json.loads(filter_key) if filter_key else None
+        return tuple(self._search(query_embedding, top_k, filter_metadata))
+
+    @abstractmethod
+    def _search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int,
+        filter_metadata: Optional[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """Search the backend for similar papers."""
+
+    async def search_async(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 5,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search for similar papers without blocking the event loop.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results to return
+            filter_metadata: Optional metadata filters
+
+        Returns:
+            List of result dictionaries with id, distance, and metadata
+        """
+        return await asyncio.to_thread(self.search, query_embedding, top_k, filter_metadata)
+
+    @abstractmethod
+    def get_paper(self, paper_id: str) -> Optional[Dict[str, Any]]:
+        """Get a paper by ID."""
+
+    @abstractmethod
+    def list_all_papers(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
+        """List one page of papers in the database."""
+
+    def search_batch(
+        self,
+        query_embeddings: List[np.ndarray],
+        top_k: int = 5,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for similar papers for several queries at once.
+
+        Backends that can serve a batch with one index call override this.
+
+        Args:
+            query_embeddings: Query embedding vectors
+            top_k: Number of results to return per query
+            filter_metadata: Optional metadata filters
+
+        Returns:
+            One list of result dictionaries per query, in query order
+        """
+        return [self.search(query, top_k, filter_metadata) for query in query_embeddings]
+
+    async def search_batch_async(
+        self,
+        query_embeddings: List[np.ndarray],
+        top_k: int = 5,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for several queries without blocking the event loop.
+
+        Args:
+            query_embeddings: Query embedding vectors
+            top_k: Number of results to return per query
+            filter_metadata: Optional metadata filters
+
+        Returns:
+            One list of result dictionaries per query, in query order
+        """
+        return await asyncio.to_thread(self.search_batch, query_embeddings, top_k, filter_metadata)
+
+    def delete_paper(self, paper_id: str) -> bool:
+        """
+        Delete a paper from the database.
+
+        Args:
+            paper_id: Paper ID
+
+        Returns:
+            True if deleted, False otherwise
+        """
+        deleted = self._delete_paper(paper_id)
+        self._generation += 1
+        return deleted
+
+    @abstractmethod
+    def _delete_paper(self, paper_id: str) -> bool:
+        """Delete a paper from the backend."""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Get the number of papers in the database."""
+
+    def flush(self) -> None:
+        """Write any buffered changes to disk (no-op for backends that persist every write)."""
+
+
+class VectorStore(BaseVectorStore):
+    """Vector store for paper embeddings using Chroma."""
+
+    def __init__(
+        self,
+        embedder,
+        persist_directory: str = "db/chroma",
+        hnsw_m: int = 24,
+        hnsw_construction_ef: int = 128,
+        hnsw_search_ef: int = 100,
+        hnsw_num_threads: Optional[int] = None,
+        brute_force_threshold: int = BRUTE_FORCE_MAX_PAPERS,
+        segment_cache_bytes: int = SEGMENT_CACHE_BYTES,
+    ):
+        """
+        Initialize the vector store.
+
+        The HNSW parameters only take effect when the collection is created;
+        to change them for an existing database, delete and recreate it.
+
+        While the collection holds fewer than ``brute_force_threshold``
+        papers, unfiltered and exact-match filtered searches scan an
+        in-memory embedding matrix instead of traversing the HNSW graph.
+
+        Args:
+            embedder: Embedder instance for generating embeddings
+            persist_directory: Directory to persist Chroma database
+            hnsw_m: Maximum number of neighbors per node in the HNSW graph
+            hnsw_construction_ef: Candidate list size when building the graph
+            hnsw_search_ef: Candidate list size when searching the graph
+            hnsw_num_threads: Threads used for HNSW operations (default: CPU count)
+            brute_force_threshold: Collection size up to which searches use
+                the exact in-memory scan
+            segment_cache_bytes: Memory budget for Chroma's LRU segment cache
+        """
+        super().__init__(embedder)
+        self.persist_directory = Path(persist_directory)
+        self.persist_directory.mkdir(parents=True, exist_ok=True)
+
+        # Initialize Chroma client
+        self.client = chromadb.PersistentClient(
+            path=str(self.persist_directory),
+            settings=Settings(
+                anonymized_telemetry=False,
+                chroma_segment_cache_policy="LRU",
+                chroma_memory_limit_bytes=segment_cache_bytes,
+            ),
         )
+        self._enable_wal()
+
+        # Get or create collection
+        self.collection = self.client.get_or_create_collection(
+            name="ml_papers",
+            metadata={
+                "hnsw:space": "cosine",  # Use cosine similarity
+                "hnsw:M": hnsw_m,
+                "hnsw:construction_ef": hnsw_construction_ef,
+                "hnsw:search_ef": hnsw_search_ef,
+                "hnsw:num_threads": hnsw_num_threads or os.cpu_count() or 1,
+            },
+        )
+
+        # Paper count is reconciled from Chroma once, then kept incrementally
+        self._n = self.collection.count()
+
+        # In-memory copy of the embeddings for the brute-force fast path
+        self.brute_force_threshold = brute_force_threshold
+        self._matrix_lock = threading.Lock()
+        self._matrix: Optional[_EmbeddingMatrix] = None
+        if self._n < brute_force_threshold:
+            self._matrix = _EmbeddingMatrix(embedder.get_embedding_dim())
+            # Load in pages so only one page of embeddings is boxed at a time
+            for offset in range(0, self._n, MIRROR_LOAD_PAGE_SIZE):
+                page = self.collection.get(
+                    limit=MIRROR_LOAD_PAGE_SIZE,
+                    offset=offset,
+                    include=["embeddings", "metadatas"],
+                )
+                if not page["ids"]:
+                    break
+                self._matrix.add(
+                    page["ids"],
+                    np.asarray(page["embeddings"], dtype=np.float32),
+                    page["metadatas"],
+                )
+
+    def _enable_wal(self) -> None:
+        """
+        Switch Chroma's SQLite database to write-ahead logging.
+
+        The journal mode is stored in the database file, so it also applies to
+        the connections Chroma opens. Failures are logged and ignored.
+        """
+        try:
+            with closing(sqlite3.connect(self.persist_directory / "chroma.sqlite3")) as conn:
+                conn.execute("PRAGMA journal_mode=WAL")
+        except sqlite3.Error as e:
+            logger.warning(f"Could not enable WAL journal mode for Chroma: {e}")
+
+    def is_ready(self) -> bool:
+        """Check if vector store is ready."""
+        try:
+            return self.collection is not None
+        except Exception:
+            return False
+
+    def _add_records(
+        self,
+        ids: List[str],
+        embeddings: np.ndarray,
+        metadatas: List[Dict[str, Any]],
+    ) -> None:
+        """Add built records to the Chroma collection."""
+        self.collection.add(ids=ids, embeddings=embeddings, metadatas=metadatas)
+
+        with self._matrix_lock:
+            self._n += len(ids)
+            if self._matrix is not None:
+                if len(self._matrix) + len(ids) >= self.brute_force_threshold:
+                    # Large enough that the HNSW index is the better choice
+                    self._matrix = None
+                else:
+                    self._matrix.add(ids, embeddings, metadatas)
+
+    def _brute_force_search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """
+        Search by scanning every embedding with one matrix-vector product.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results to return
+            filter_metadata: Optional exact-match metadata filters
+
+        Returns:
+            List of result dictionaries with id, distance, and metadata, or
+            None if the collection is too large for the brute-force path
+        """
+        with self._matrix_lock:
+            if self._matrix is None:
+                return None
+            matches = self._matrix.top_k(query_embedding, top_k, filter_metadata)
+
+        return [
+            {"id": paper_id, "distance": 1.0 - similarity, "metadata": metadata}
+            for paper_id, similarity, metadata in matches
+        ]
+
+    def _search(
+        self,
+        query_embedding: np.ndarray,
+        top_k: int = 5,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[Dict[str, Any]]:
+        """
+        Search the Chroma collection for similar papers.
+
+        Args:
+            query_embedding: Query embedding vector
+            top_k: Number of results to return
+            filter_metadata: Optional metadata filters
+
+        Returns:
+            List of result dictionaries with id, distance, and metadata
+        """
+        if filter_metadata is None or _is_exact_match_filter(filter_metadata):
+            results = self._brute_force_search(query_embedding, top_k, filter_metadata)
+            if results is not None:
+                return results
+
+        # Pass the ndarray as a (1, D) batch rather than converting it here; Chroma
+        # still turns it into a list of floats internally, so this saves our own
+        # .tolist() copy, not the boxing
+        query = np.ascontiguousarray(query_embedding, dtype=np.float32)
 
         # Perform search
         results = self.collection.query(
-            query_embeddings=[query_embedding_list],
+            query_embeddings=query[None, :],
+            n_results=top_k,
+            where=_chroma_where(filter_metadata),
+            include=["metadatas", "distances"],
+        )
+
+        return self._format_query_results(results, 0)
+
+    def search_batch(
+        self,
+        query_embeddings: List[np.ndarray],
+        top_k: int = 5,
+        filter_metadata: Optional[Dict[str, Any]] = None,
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Search for similar papers for several queries with one Chroma query.
+
+        Small collections use the cached brute-force path instead, unless the
+        filter needs Chroma's operators.
+
+        Args:
+            query_embeddings: Query embedding vectors
+            top_k: Number of results to return per query
+            filter_metadata: Optional metadata filters
+
+        Returns:
+            One list of result dictionaries per query, in query order
+        """
+        if not query_embeddings:
+            return []
+        if self._matrix is not None and (
+            filter_metadata is None or _is_exact_match_filter(filter_metadata)
+        ):
+            return super().search_batch(query_embeddings, top_k, filter_metadata)
+
+        results = self.collection.query(
+            query_embeddings=np.vstack(query_embeddings).astype(np.float32, copy=False),
             n_results=top_k,
-            where=filter_metadata,
+            where=_chroma_where(filter_metadata),
+            include=["metadatas", "distances"],
         )
+        return [self._format_query_results(results, row) for row in range(len(query_embeddings))]
+
+    @staticmethod
+    def _format_query_results(results: Dict[str, Any], row: int) -> List[Dict[str, Any]]:
+        """
+        Convert one query's rows of a collection.query output into result dicts.
+
+        Args:
+            results: Result of a Chroma collection.query call
+            row: Index of the query within the batch
 
-        # Format results
-        formatted_results = []
-        if results["ids"] and len(results["ids"][0]) > 0:
-            for i in range(len(results["ids"][0])):
-                result = {
-                    "id": results["ids"][0][i],
-                    "distance": results["distances"][0][i] if results["distances"] else None,
-                    "metadata": results["metadatas"][0][i] if results["metadatas"] else {},
-                    "document": results["documents"][0][i] if results["documents"] else "",
-                }
-                formatted_results.append(result)
+        Returns:
+            List of result dictionaries with id, distance, and metadata
+        """
+        if not results["ids"] or not results["ids"][row]:
+            return []
+        ids = results["ids"][row]
+        distances = results["distances"][row] if results["distances"] else [None] * len(ids)
+        metadatas = results["metadatas"][row] if results["metadatas"] else [{}] * len(ids)
 
-        return formatted_results
+        return [
+            {"id": paper_id, "distance": distance, "metadata": metadata}
+            for paper_id, distance, metadata in zip(ids, distances, metadatas)
+        ]
+
+    @staticmethod
+    def _format_get_results(results: Dict[str, Any]) -> List[Dict[str, Any]]:
+        """
+        Convert the column-oriented output of collection.get into paper dicts.
+
+        Args:
+            results: Result of a Chroma collection.get call
+
+        Returns:
+            List of paper dictionaries with id and metadata
+        """
+        ids = results["ids"]
+        if not ids:
+            return []
+        metadatas = results["metadatas"] if results["metadatas"] else [{}] * len(ids)
+
+        return [
+            {"id": paper_id, "metadata": metadata}
+            for paper_id, metadata in zip(ids, metadatas)
+        ]
 
     def get_paper(self, paper_id: str) -> Optional[Dict[str, Any]]:
         """
@@ -148,44 +782,34 @@ class VectorStore:
             Paper data dictionary or None if not found
         """
         try:
-            results = self.collection.get(ids=[paper_id])
-            if results["ids"] and len(results["ids"]) > 0:
-                return {
-                    "id": results["ids"][0],
-                    "metadata": results["metadatas"][0] if results["metadatas"] else {},
-                    "document": results["documents"][0] if results["documents"] else "",
-                }
-            return None
+            papers = self._format_get_results(self.collection.get(ids=[paper_id], include=["metadatas"]))
+            return papers[0] if papers else None
 
         except Exception:
             return None
 
-    def list_all_papers(self) -> List[Dict[str, Any]]:
+    def list_all_papers(self, limit: int = 100, offset: int = 0) -> List[Dict[str, Any]]:
         """
-        List all papers in the database.
+        List one page of papers in the database.
+
+        Args:
+            limit: Maximum number of papers to return
+            offset: Number of papers to skip
 
         Returns:
             List of paper dictionaries
         """
         try:
-            results = self.collection.get()
-            papers = []
-            if results["ids"]:
-                for i in range(len(results["ids"])):
-                    paper = {
-                        "id": results["ids"][i],
-                        "metadata": results["metadatas"][i] if results["metadatas"] else {},
-                        "document": results["documents"][i] if results["documents"] else "",
-                    }
-                    papers.append(paper)
-            return papers
+            return self._format_get_results(
+                self.collection.get(limit=limit, offset=offset, include=["metadatas"])
+            )
 
         except Exception:
             return []
 
-    def delete_paper(self, paper_id: str) -> bool:
+    def _delete_paper(self, paper_id: str) -> bool:
         """
-        Delete a paper from the database.
+        Delete a paper from the Chroma collection.
 
         Args:
             paper_id: Paper ID
@@ -194,15 +818,43 @@ class VectorStore:
             True if deleted, False otherwise
         """
         try:
+            existed = bool(self.collection.get(ids=[paper_id], include=[])["ids"])
             self.collection.delete(ids=[paper_id])
+            with self._matrix_lock:
+                if existed:
+                    self._n -= 1
+                if self._matrix is not None:
+                    self._matrix.remove(paper_id)
             return True
         except Exception:
             return False
 
     def count(self) -> int:
         """Get the number of papers in the database."""
-        try:
-            return self.collection.count()
-        except Exception:
-            return 0
-
+        return self._n
+
+
+def create_vector_store(embedder, backend: Optional[str] = None, **kwargs: Any) -> BaseVectorStore:
+    """
+    Create a vector store for the configured backend.
+
+    Args:
+        embedder: Embedder instance for generating embeddings
+        backend: "chroma" or "usearch". If None, reads from the
+            VECTOR_STORE_BACKEND env var (default: chroma). The usearch
+            backend also reads its quantization from VECTOR_STORE_QUANTIZATION.
+        **kwargs: Additional arguments for the backend constructor
+
+    Returns:
+        Vector store instance
+    """
+    backend = (backend or os.getenv("VECTOR_STORE_BACKEND", "chroma")).lower()
+    if backend == "chroma":
+        return VectorStore(embedder, **kwargs)
+    if backend == "usearch":
+        # Imported lazily so usearch stays an optional dependency
+        from app.usearch_store import USearchVectorStore
+
+        kwargs.setdefault("quantization", os.getenv("VECTOR_STORE_QUANTIZATION", "f32"))
+        return USearchVectorStore(embedder, **kwargs)
+    raise ValueError(f"Unknown vector store backend: {backend}")
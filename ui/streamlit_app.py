@@ -1,18 +1,63 @@
 """Streamlit UI for Pocket ML Paper RAG."""
 
+import math
 import os
-import sys
-from pathlib import Path
+import time
+from concurrent.futures import ThreadPoolExecutor
 
+import orjson
 import requests
 import streamlit as st
-
-# Add parent directory to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+from requests.adapters import HTTPAdapter
+from requests_toolbelt import MultipartEncoder, MultipartEncoderMonitor
+from urllib3.util.retry import Retry
 
 # API base URL
 API_BASE_URL = os.getenv("API_BASE_URL", "http://localhost:8000")
 
+# Request timeouts in seconds (uploads include PDF parsing and LLM calls)
+REQUEST_TIMEOUT = 60
+UPLOAD_TIMEOUT = 300
+
+# Seconds a completed search is reused for an identical query and top_k
+SEARCH_CACHE_TTL = 600
+
+# Largest PDF accepted by the API's upload endpoint
+MAX_PDF_BYTES = 50 * 1024 * 1024  # 50 MiB
+
+# Most queries the API's batch search endpoint accepts per request
+MAX_BATCH_QUERIES = 10
+
+# Page sizes offered on the browse page
+BROWSE_PAGE_SIZES = [25, 50, 100]
+
+# Number of paper expanders rendered at first and per "Load more" click
+BROWSE_RENDER_STEP = 25
+
+# Maximum number of concurrent DELETE requests in a bulk delete
+BULK_DELETE_WORKERS = 6
+
+
+@st.cache_resource
+def _session() -> requests.Session:
+    """Get a shared HTTP session so connections to the API are kept alive."""
+    session = requests.Session()
+    session.headers.update({"Accept-Encoding": "gzip"})
+    adapter = HTTPAdapter(
+        pool_connections=8,
+        pool_maxsize=16,
+        # Retry failed connections only; a read timeout may mean the request is still running
+        max_retries=Retry(total=3, connect=3, read=0, status=0, backoff_factor=0.3),
+    )
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def _json(response):
+    """Decode a JSON response body with orjson, which is faster than requests' json()."""
+    return orjson.loads(response.content)
+
 
 def main():
     """Main Streamlit application."""
@@ -42,215 +87,558 @@ def main():
 
 def show_upload_page():
     """Show the paper upload page."""
-    st.header("Upload a Research Paper")
+    st.header("Upload Research Papers")
 
-    uploaded_file = st.file_uploader(
-        "Choose a PDF file",
+    uploaded_files = st.file_uploader(
+        "Choose PDF files",
         type="pdf",
-        help="Upload a research paper in PDF format",
+        accept_multiple_files=True,
+        help="Upload one or more research papers in PDF format",
     )
 
     title_override = st.text_input(
         "Paper Title (optional)",
-        help="If left empty, the title will be extracted from the PDF",
+        help="If left empty, the title will be extracted from the PDF. "
+        "Only used when uploading a single paper.",
     )
 
     if st.button("Upload and Process", type="primary"):
-        if uploaded_file is None:
+        if not uploaded_files:
             st.error("Please upload a PDF file")
             return
 
-        with st.spinner("Processing paper... This may take a minute."):
-            try:
-                # Prepare file for upload
-                files = {"file": (uploaded_file.name, uploaded_file.getvalue(), "application/pdf")}
-                params = {}
-                if title_override:
-                    params["title"] = title_override
-
-                # Upload to API
-                response = requests.post(
-                    f"{API_BASE_URL}/upload_pdf",
-                    files=files,
-                    params=params,
+        # Reject files the API would refuse before sending them
+        for uploaded_file in uploaded_files:
+            if uploaded_file.size > MAX_PDF_BYTES:
+                st.error(
+                    f"❌ {uploaded_file.name} is larger than the "
+                    f"{MAX_PDF_BYTES // (1024 * 1024)} MiB limit"
                 )
+                return
+            uploaded_file.seek(0)
+            if uploaded_file.read(4) != b"%PDF":
+                st.error(f"❌ {uploaded_file.name} is not a valid PDF")
+                return
 
-                if response.status_code == 200:
-                    data = response.json()
-                    st.success("✅ Paper uploaded and processed successfully!")
+        try:
+            if len(uploaded_files) == 1:
+                _upload_paper(uploaded_files[0], title_override)
+            else:
+                _upload_papers(uploaded_files)
 
-                    # Display results
-                    st.subheader("Paper Summary")
-                    st.write(f"**Title:** {data['title']}")
-                    st.write(f"**Paper ID:** `{data['paper_id']}`")
+        except Exception as e:
+            st.error(f"❌ Error uploading paper: {str(e)}")
 
-                    st.subheader("Summary")
-                    st.write(data["summary"])
 
-                    st.subheader("Keywords")
-                    keywords = data.get("keywords", [])
-                    if keywords:
-                        st.write(", ".join(keywords))
+class _UploadBody:
+    """
+    Readable view of an uploaded file for MultipartEncoder.
 
-                    st.subheader("Content Snippet")
-                    st.write(data["content_snippet"])
+    Exposes only ``read`` and the remaining length, so the encoder streams
+    the file in chunks instead of copying its buffer through ``getvalue()``.
+    """
 
-                else:
-                    error_msg = response.json().get("detail", "Unknown error")
-                    st.error(f"❌ Error: {error_msg}")
+    def __init__(self, uploaded_file):
+        self._file = uploaded_file
+        self._file.seek(0)
 
-            except Exception as e:
-                st.error(f"❌ Error uploading paper: {str(e)}")
+    @property
+    def len(self):
+        return self._file.size - self._file.tell()
+
+    def read(self, size=-1):
+        return self._file.read(size)
+
+
+def _post_multipart(url, encoder, params=None):
+    """POST a multipart body, showing a progress bar while its bytes are sent."""
+    progress = st.progress(0.0, text="Uploading...")
+    last_percent = -1
+
+    def update(monitor):
+        nonlocal last_percent
+        percent = monitor.bytes_read * 100 // monitor.len
+        # Only send a UI update when the displayed percentage changes
+        if percent != last_percent:
+            last_percent = percent
+            text = (
+                "Processing... This may take a minute."
+                if percent >= 100
+                else f"Uploading... {percent}%"
+            )
+            progress.progress(percent / 100, text=text)
+
+    monitor = MultipartEncoderMonitor(encoder, update)
+    try:
+        return _session().post(
+            url,
+            data=monitor,
+            headers={"Content-Type": monitor.content_type},
+            params=params,
+            timeout=UPLOAD_TIMEOUT,
+        )
+    finally:
+        progress.empty()
+
+
+def _upload_paper(uploaded_file, title_override):
+    """Upload a single PDF and show the processed paper."""
+    encoder = MultipartEncoder(
+        fields={"file": (uploaded_file.name, _UploadBody(uploaded_file), "application/pdf")}
+    )
+    params = {}
+    if title_override:
+        params["title"] = title_override
+
+    # Upload to API
+    response = _post_multipart(f"{API_BASE_URL}/upload_pdf", encoder, params)
+
+    if response.status_code == 200:
+        st.success("✅ Paper uploaded and processed successfully!")
+        _clear_caches()
+        _render_uploaded_paper(_json(response))
+
+    else:
+        error_msg = _json(response).get("detail", "Unknown error")
+        st.error(f"❌ Error: {error_msg}")
+
+
+def _upload_papers(uploaded_files):
+    """Upload several PDFs in one request and show each processed paper."""
+    encoder = MultipartEncoder(
+        fields=[
+            ("files", (uploaded_file.name, _UploadBody(uploaded_file), "application/pdf"))
+            for uploaded_file in uploaded_files
+        ]
+    )
+
+    response = _post_multipart(f"{API_BASE_URL}/upload_pdfs", encoder)
+
+    if response.status_code != 200:
+        error_msg = _json(response).get("detail", "Unknown error")
+        st.error(f"❌ Error: {error_msg}")
+        return
+
+    results = _json(response).get("results", [])
+    succeeded = [result for result in results if "error" not in result]
+    if succeeded:
+        st.success(f"✅ {len(succeeded)} of {len(results)} papers uploaded and processed!")
+        _clear_caches()
+
+    for result in results:
+        if "error" in result:
+            st.error(f"❌ {result['filename']}: {result['error']}")
+        else:
+            with st.expander(f"📄 {result['title']}"):
+                _render_uploaded_paper(result)
+
+
+def _render_uploaded_paper(data):
+    """Render the summary of a processed paper."""
+    st.subheader("Paper Summary")
+    st.write(f"**Title:** {data['title']}")
+    st.write(f"**Paper ID:** `{data['paper_id']}`")
+
+    st.subheader("Summary")
+    st.write(data["summary"])
+
+    st.subheader("Keywords")
+    keywords = data.get("keywords", [])
+    if keywords:
+        st.write(", ".join(keywords))
+
+    st.subheader("Content Snippet")
+    st.write(data["content_snippet"])
 
 
 def show_search_page():
     """Show the search page."""
     st.header("Search for Similar Papers")
 
-    query = st.text_input(
-        "Enter your search query",
-        placeholder='e.g., "papers similar to SAM" or "contrastive learning"',
-        help="Describe what kind of papers you're looking for",
-    )
+    # Inputs only trigger a rerun when the form is submitted
+    with st.form("search"):
+        query_text = st.text_area(
+            "Enter your search query",
+            placeholder='e.g., "papers similar to SAM" or "contrastive learning"',
+            help="Describe what kind of papers you're looking for. "
+            "Enter one query per line to run several searches at once.",
+            height=80,
+        )
+
+        top_k = st.slider("Number of results", min_value=1, max_value=20, value=5)
 
-    top_k = st.slider("Number of results", min_value=1, max_value=20, value=5)
+        submitted = st.form_submit_button("Search", type="primary")
 
-    if st.button("Search", type="primary"):
-        if not query or not query.strip():
+    if submitted:
+        queries = [line.strip() for line in query_text.splitlines() if line.strip()]
+        if not queries:
             st.error("Please enter a search query")
             return
+        if len(queries) > MAX_BATCH_QUERIES:
+            st.error(f"Please enter at most {MAX_BATCH_QUERIES} queries")
+            return
 
         with st.spinner("Searching papers and generating explanations..."):
             try:
-                response = requests.get(
-                    f"{API_BASE_URL}/search",
-                    params={"query": query, "top_k": top_k},
-                )
+                if len(queries) == 1:
+                    _stream_search_results(queries[0], top_k)
+                    return
+
+                for result in _search_batch_cached(tuple(queries), top_k).get("results", []):
+                    st.subheader(f"🔎 {result['query']}")
+                    _render_search_results(result)
+
+            except Exception as e:
+                st.error(f"❌ Error searching: {str(e)}")
+
+
+@st.cache_data(ttl=SEARCH_CACHE_TTL, show_spinner=False)
+def _search_batch_cached(queries, top_k):
+    """Run a multi-query search, cached so repeated searches skip the LLM round trip."""
+    response = _session().get(
+        f"{API_BASE_URL}/search_batch",
+        params={"queries": list(queries), "top_k": top_k},
+        timeout=REQUEST_TIMEOUT,
+    )
+    if response.status_code != 200:
+        # Raising keeps error responses out of the cache
+        raise RuntimeError(_json(response).get("detail", "Unknown error"))
+    return _json(response)
+
+
+@st.cache_resource
+def _stream_cache():
+    """Get the completed streamed searches, shared by all sessions."""
+    return {}
+
+
+def _clear_caches():
+    """Drop cached listings and search results after papers change."""
+    _fetch_papers.clear()
+    _search_batch_cached.clear()
+    _stream_cache().clear()
+
+
+def _render_search_results(data):
+    """Render the papers and explanations of one search response."""
+    results = data.get("results", [])
+
+    if not results:
+        st.info("No papers found matching your query.")
+        return
+
+    st.success(f"Found {len(results)} similar papers")
+
+    # Display results
+    for i, result in enumerate(results, 1):
+        _render_paper(i, result["paper"], result["explanation"])
+
+
+def _stream_search_results(query, top_k):
+    """Render search results as the API streams each paper with its explanation."""
+    cache = _stream_cache()
+    now = time.monotonic()
+    cached = cache.get((query, top_k))
+    if cached and now - cached[0] < SEARCH_CACHE_TTL:
+        _render_search_results(cached[1])
+        return
+
+    with _session().get(
+        f"{API_BASE_URL}/search_stream",
+        params={"query": query, "top_k": top_k},
+        # Compression would buffer the stream and delay each result
+        headers={"Accept-Encoding": "identity"},
+        stream=True,
+        timeout=REQUEST_TIMEOUT,
+    ) as response:
+        if response.status_code != 200:
+            error_msg = _json(response).get("detail", "Unknown error")
+            st.error(f"❌ Error: {error_msg}")
+            return
+
+        # Papers arrive in the order their explanations finish; slots keep rank order
+        status = st.empty()
+        slots = [st.empty() for _ in range(top_k)]
+        events = []
+        for line in response.iter_lines():
+            if not line:
+                continue
+            event = orjson.loads(line)
+            if "error" in event:
+                st.error(f"❌ Error: {event['error']}")
+                return
+            events.append(event)
+            with slots[event["rank"]].container():
+                _render_paper(event["rank"] + 1, event["paper"], event["explanation"])
+
+    if events:
+        status.success(f"Found {len(events)} similar papers")
+    else:
+        status.info("No papers found matching your query.")
+
+    # Keep the completed search in rank order, dropping expired entries
+    events.sort(key=lambda event: event["rank"])
+    expired = [
+        key for key, (created, _) in list(cache.items()) if now - created >= SEARCH_CACHE_TTL
+    ]
+    for key in expired:
+        cache.pop(key, None)
+    cache[(query, top_k)] = (
+        now,
+        {
+            "query": query,
+            "results": [
+                {"paper": event["paper"], "explanation": event["explanation"]}
+                for event in events
+            ],
+        },
+    )
+
 
+def _render_paper(rank, paper, explanation):
+    """Render one search result with its explanation."""
+    with st.expander(
+        f"📄 {rank}. {paper['title']} (Similarity: {paper['similarity_score']:.2%})",
+        expanded=(rank == 1),
+    ):
+        st.markdown(f"**Paper ID:** `{paper['id']}`\n\n**Why this paper is relevant:**")
+        st.info(explanation)
+        st.markdown(
+            _paper_markdown(
+                None,
+                paper["summary"],
+                ", ".join(paper.get("keywords", [])),
+                paper["content_snippet"],
+            )
+        )
+
+
+def _paper_markdown(paper_id, summary, keywords, content_snippet=None):
+    """Build the markdown body of a paper, skipping empty fields."""
+    sections = []
+    if paper_id:
+        sections.append(f"**Paper ID:** `{paper_id}`")
+    if summary:
+        sections.append(f"**Summary:**\n\n{summary}")
+    if keywords:
+        sections.append(f"**Keywords:**\n\n{keywords}")
+    if content_snippet:
+        sections.append(f"**Content Snippet:**\n\n{content_snippet}")
+    return "\n\n".join(sections)
+
+
+@st.cache_data(ttl=60, show_spinner=False)
+def _fetch_papers(limit, offset):
+    """Fetch one page of papers, cached so reruns do not refetch unchanged data."""
+    response = _session().get(
+        f"{API_BASE_URL}/papers",
+        params={"limit": limit, "offset": offset},
+        timeout=REQUEST_TIMEOUT,
+    )
+    if response.status_code != 200:
+        # Raising keeps error responses out of the cache
+        raise RuntimeError(_json(response).get("detail", "Unknown error"))
+    return _json(response)
+
+
+@st.dialog("Confirm deletion")
+def _confirm_delete(paper_id, title):
+    """Ask for confirmation, then delete a paper and refresh the listing."""
+    st.write(f"Delete **{title}**? This cannot be undone.")
+    col_yes, col_no = st.columns(2)
+    with col_yes:
+        if st.button("✅ Delete", type="primary"):
+            try:
+                response = _session().delete(
+                    f"{API_BASE_URL}/papers/{paper_id}",
+                    timeout=REQUEST_TIMEOUT,
+                )
                 if response.status_code == 200:
-                    data = response.json()
-                    papers = data.get("papers", [])
-                    explanations = data.get("explanations", [])
+                    _clear_caches()
+                    st.rerun()
+                else:
+                    error_msg = _json(response).get("detail", "Unknown error")
+                    st.error(f"❌ Error: {error_msg}")
+            except Exception as e:
+                st.error(f"❌ Error: {str(e)}")
+    with col_no:
+        if st.button("❌ Cancel"):
+            st.rerun()
 
-                    if not papers:
-                        st.info("No papers found matching your query.")
-                        return
 
-                    st.success(f"Found {len(papers)} similar papers")
+def _set_browse_page(page):
+    """Move the browse page to a given page number (runs before the rerun)."""
+    st.session_state.browse_page = page
+    _reset_page_state()
 
-                    # Display results
-                    for i, (paper, explanation) in enumerate(zip(papers, explanations), 1):
-                        with st.expander(
-                            f"📄 {i}. {paper['title']} (Similarity: {paper['similarity_score']:.2%})",
-                            expanded=(i == 1),
-                        ):
-                            st.write(f"**Paper ID:** `{paper['id']}`")
 
-                            st.write("**Why this paper is relevant:**")
-                            st.info(explanation)
+def _reset_page_state():
+    """Reset the bulk delete selection and rendered rows, which cover one page."""
+    st.session_state.to_delete = []
+    st.session_state.browse_limit = BROWSE_RENDER_STEP
 
-                            st.write("**Summary:**")
-                            st.write(paper["summary"])
 
-                            if paper.get("keywords"):
-                                st.write("**Keywords:**")
-                                st.write(", ".join(paper["keywords"]))
+def _delete_paper(session, paper_id):
+    """
+    Delete one paper through the API, returning whether it succeeded.
 
-                            st.write("**Content Snippet:**")
-                            st.write(paper["content_snippet"])
+    Runs in worker threads, so it takes the session rather than calling
+    Streamlit's cached _session() itself.
+    """
+    try:
+        response = session.delete(
+            f"{API_BASE_URL}/papers/{paper_id}",
+            timeout=REQUEST_TIMEOUT,
+        )
+        return response.status_code == 200
+    except requests.RequestException:
+        return False
 
-                else:
-                    error_msg = response.json().get("detail", "Unknown error")
-                    st.error(f"❌ Error: {error_msg}")
 
-            except Exception as e:
-                st.error(f"❌ Error searching: {str(e)}")
+def _delete_selected():
+    """Delete the papers selected for bulk deletion with concurrent requests."""
+    paper_ids = st.session_state.get("to_delete", [])
+    session = _session()
+    with ThreadPoolExecutor(max_workers=BULK_DELETE_WORKERS) as executor:
+        results = list(executor.map(lambda paper_id: _delete_paper(session, paper_id), paper_ids))
+
+    _reset_page_state()
+    _clear_caches()
+
+    failed = results.count(False)
+    if failed:
+        st.error(f"❌ Failed to delete {failed} of {len(paper_ids)} papers")
+    else:
+        st.success(f"✅ Deleted {len(paper_ids)} papers")
 
 
 def show_browse_page():
     """Show the browse all papers page."""
     st.header("Browse All Papers")
 
-    col1, col2 = st.columns([1, 4])
+    if "browse_page" not in st.session_state:
+        st.session_state.browse_page = 1
+    if "browse_limit" not in st.session_state:
+        st.session_state.browse_limit = BROWSE_RENDER_STEP
+
+    col1, col2, col3 = st.columns([1, 2, 2])
     with col1:
         if st.button("🔄 Refresh", type="primary"):
+            _fetch_papers.clear()
             st.rerun()
 
-    try:
-        response = requests.get(f"{API_BASE_URL}/papers")
-
-        if response.status_code == 200:
-            data = response.json()
-            papers = data.get("papers", [])
-            count = data.get("count", 0)
+    with col2:
+        page_size = st.selectbox(
+            "Papers per page", BROWSE_PAGE_SIZES, on_change=_set_browse_page, args=(1,)
+        )
 
-            st.info(f"Total papers in database: {count}")
+    with col3:
+        page = st.number_input(
+            "Page", min_value=1, step=1, key="browse_page", on_change=_reset_page_state
+        )
 
-            if not papers:
+    try:
+        data = _fetch_papers(page_size, (page - 1) * page_size)
+        papers = data.get("papers", [])
+        total = data.get("total", 0)
+        page_count = max(1, math.ceil(total / page_size))
+
+        st.info(f"Total papers in database: {total}")
+
+        col_prev, col_page, col_next = st.columns([1, 2, 1])
+        with col_prev:
+            st.button(
+                "◀ Previous",
+                disabled=page <= 1,
+                on_click=_set_browse_page,
+                args=(page - 1,),
+            )
+        with col_page:
+            st.write(f"Page {page} of {page_count}")
+        with col_next:
+            st.button(
+                "Next ▶",
+                disabled=page >= page_count,
+                on_click=_set_browse_page,
+                args=(page + 1,),
+            )
+
+        if not papers:
+            if total:
+                st.info("No papers on this page.")
+            else:
                 st.info("No papers in database yet. Upload some papers to get started!")
-                return
+            return
 
-            # Display papers
+        # Filter the fetched page in memory instead of going through the search API
+        text_filter = st.text_input("Filter this page by title or keywords").strip().lower()
+        if text_filter:
+            matching = []
             for paper in papers:
                 metadata = paper.get("metadata", {})
-                title = metadata.get("title", "Unknown")
-                summary = metadata.get("summary", "")
-                paper_id = paper.get("id", "")
-
-                with st.expander(f"📄 {title}"):
-                    col_info, col_delete = st.columns([4, 1])
-                    
-                    with col_info:
-                        st.write(f"**Paper ID:** `{paper_id}`")
-                        if summary:
-                            st.write("**Summary:**")
-                            st.write(summary)
-
-                        keywords = metadata.get("keywords", "")
-                        if keywords:
-                            st.write("**Keywords:**")
-                            st.write(keywords.replace(",", ", "))
-                    
-                    with col_delete:
-                        st.write("")  # Spacing
-                        # Delete button with confirmation
-                        delete_key = f"delete_{paper_id}"
-                        if delete_key not in st.session_state:
-                            st.session_state[delete_key] = False
-                        
-                        if st.session_state[delete_key]:
-                            # Confirmation state
-                            st.warning("⚠️ Confirm deletion?")
-                            col_yes, col_no = st.columns(2)
-                            with col_yes:
-                                if st.button("✅ Yes", key=f"yes_{paper_id}"):
-                                    # Actually delete
-                                    try:
-                                        delete_response = requests.delete(f"{API_BASE_URL}/papers/{paper_id}")
-                                        if delete_response.status_code == 200:
-                                            st.success(f"✅ Paper deleted!")
-                                            st.session_state[delete_key] = False
-                                            st.rerun()
-                                        else:
-                                            error_msg = delete_response.json().get("detail", "Unknown error")
-                                            st.error(f"❌ Error: {error_msg}")
-                                            st.session_state[delete_key] = False
-                                    except Exception as e:
-                                        st.error(f"❌ Error: {str(e)}")
-                                        st.session_state[delete_key] = False
-                            with col_no:
-                                if st.button("❌ Cancel", key=f"no_{paper_id}"):
-                                    st.session_state[delete_key] = False
-                                    st.rerun()
-                        else:
-                            # Initial state - show delete button
-                            if st.button("🗑️ Delete", key=f"btn_{paper_id}", type="secondary"):
-                                st.session_state[delete_key] = True
-                                st.rerun()
+                if (
+                    text_filter in metadata.get("title", "").lower()
+                    or text_filter in metadata.get("keywords", "").lower()
+                ):
+                    matching.append(paper)
+            papers = matching
+            if not papers:
+                st.info("No papers on this page match the filter.")
+                return
 
-        else:
-            error_msg = response.json().get("detail", "Unknown error")
-            st.error(f"❌ Error: {error_msg}")
+        # Bulk delete of papers on the current page
+        titles = {paper["id"]: paper.get("metadata", {}).get("title", "Unknown") for paper in papers}
+        # Drop selections of papers that are gone (e.g. deleted one at a time)
+        st.session_state.to_delete = [
+            paper_id for paper_id in st.session_state.get("to_delete", []) if paper_id in titles
+        ]
+        col_select, col_bulk = st.columns([4, 1])
+        with col_select:
+            selected = st.multiselect(
+                "Select papers to delete",
+                list(titles),
+                format_func=titles.get,
+                key="to_delete",
+            )
+        with col_bulk:
+            st.write("")  # Spacing
+            st.button(
+                f"🗑️ Delete Selected ({len(selected)})",
+                disabled=not selected,
+                on_click=_delete_selected,
+            )
+
+        # Precompute each rendered row's label and markdown body in one pass
+        rows = []
+        for paper in papers[: st.session_state.browse_limit]:
+            metadata = paper.get("metadata", {})
+            title = metadata.get("title", "Unknown")
+            paper_id = paper.get("id", "")
+            body = _paper_markdown(
+                paper_id,
+                metadata.get("summary", ""),
+                metadata.get("keywords", "").replace(",", ", "),
+            )
+            rows.append((title, f"📄 {title}", paper_id, body))
+
+        # Display papers, rendering more expanders on demand
+        for title, label, paper_id, body in rows:
+            with st.expander(label):
+                col_info, col_delete = st.columns([4, 1])
+                
+                with col_info:
+                    # One markdown element per paper rather than one per field
+                    st.markdown(body)
+                
+                with col_delete:
+                    st.write("")  # Spacing
+                    if st.button("🗑️ Delete", key=f"btn_{paper_id}", type="secondary"):
+                        _confirm_delete(paper_id, title)
+
+        if len(papers) > st.session_state.browse_limit:
+            if st.button("Load more"):
+                st.session_state.browse_limit += BROWSE_RENDER_STEP
+                st.rerun()
 
     except Exception as e:
         st.error(f"❌ Error browsing papers: {str(e)}")